@@ -0,0 +1,172 @@
+import random
+import sys
+import time
+import tracemalloc
+
+from task_1.compact_linked_list import CompactLinkedList
+from task_1.linked_list_impl import LinkedList, Node
+from task_1.merge import merge_k_sorted_lists, merge_sorted_lists
+from task_1.sort import bottom_up_merge_sort_linked_list, merge_sort_linked_list
+
+# LinkedList.append проходить весь список, тому для великих N будуємо його напряму
+APPEND_LIMIT = 10 ** 4
+
+
+def build_node_list(n):
+    """
+    Builds a Node-based linked list of n elements by linking nodes directly.
+
+    :param n: The number of elements.
+    :return: The LinkedList instance.
+    """
+    return link_nodes(range(n))
+
+
+def link_nodes(values):
+    """
+    Builds a Node-based linked list from the given values in O(N).
+
+    :param values: An iterable of values.
+    :return: The LinkedList instance.
+    """
+    ll = LinkedList()
+    tail = None
+    for value in values:
+        node = Node(value)
+        if tail is None:
+            ll.head = node
+        else:
+            tail.next = node
+        tail = node
+    return ll
+
+
+def build_node_list_append(n):
+    ll = LinkedList()
+    for i in range(n):
+        ll.append(i)
+    return ll
+
+
+def build_compact_list_append(n):
+    ll = CompactLinkedList()
+    for i in range(n):
+        ll.append(i)
+    return ll
+
+
+def build_compact_list_extend(n):
+    return CompactLinkedList(range(n))
+
+
+def measure(build, n):
+    """
+    Measures build time and peak traced memory of a list builder.
+
+    :param build: A callable that takes n and returns a list.
+    :param n: The number of elements.
+    :return: A tuple of (seconds, peak bytes).
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build(n)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed, peak
+
+
+def bench_build(sizes):
+    builders = [
+        ("Node + append", build_node_list_append),
+        ("Node (direct link)", build_node_list),
+        ("Compact + append", build_compact_list_append),
+        ("Compact + extend", build_compact_list_extend),
+    ]
+    print(f"{'N':>10} {'builder':<20} {'time, s':>10} {'peak, MB':>10} {'B/elem':>8}")
+    for n in sizes:
+        for name, build in builders:
+            if build is build_node_list_append and n > APPEND_LIMIT:
+                continue
+            elapsed, peak = measure(build, n)
+            print(f"{n:>10} {name:<20} {elapsed:>10.3f} {peak / 2 ** 20:>10.1f} {peak / n:>8.1f}")
+
+
+def sort_via_python_list(head):
+    """
+    Sorts a linked list by copying the nodes into a Python list, calling sorted() and relinking.
+
+    :param head: The head node of the linked list.
+    :return: The head node of the sorted linked list.
+    """
+    nodes = []
+    while head is not None:
+        nodes.append(head)
+        head = head.next
+    nodes.sort(key=lambda node: node.data)
+    for a, b in zip(nodes, nodes[1:]):
+        a.next = b
+    if not nodes:
+        return None
+    nodes[-1].next = None
+    return nodes[0]
+
+
+def bench_sort(sizes):
+    sorters = [
+        ("recursive merge sort", merge_sort_linked_list),
+        ("bottom-up merge sort", bottom_up_merge_sort_linked_list),
+        ("sorted() + relink", sort_via_python_list),
+    ]
+    print(f"{'N':>10} {'sorter':<22} {'time, s':>10}")
+    for n in sizes:
+        values = [random.random() for _ in range(n)]
+        for name, sort in sorters:
+            ll = link_nodes(values)
+            start = time.perf_counter()
+            try:
+                sort(ll.head)
+            except RecursionError:
+                print(f"{n:>10} {name:<22} {'RecursionError':>10}")
+                continue
+            print(f"{n:>10} {name:<22} {time.perf_counter() - start:>10.3f}")
+
+
+def merge_pairwise(heads):
+    merged = None
+    for head in heads:
+        merged = merge_sorted_lists(merged, head)
+    return merged
+
+
+def bench_merge(total, ks):
+    """
+    Compares the heap-based k-way merge with folding merge_sorted_lists over K shards.
+
+    :param total: The total number of elements spread over the shards.
+    :param ks: The shard counts to try.
+    """
+    mergers = [
+        ("pairwise merge_sorted_lists", merge_pairwise),
+        ("heap k-way merge", merge_k_sorted_lists),
+    ]
+    print(f"{'K':>6} {'merger':<28} {'time, s':>10}")
+    for k in ks:
+        values = sorted(random.random() for _ in range(total))
+        shards = [values[i::k] for i in range(k)]
+        for name, merge in mergers:
+            heads = [link_nodes(shard).head for shard in shards]
+            start = time.perf_counter()
+            merge(heads)
+            print(f"{k:>6} {name:<28} {time.perf_counter() - start:>10.3f}")
+
+
+if __name__ == '__main__':
+    max_power = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    sizes = [10 ** p for p in range(4, max_power + 1)]
+    bench_build(sizes)
+    print()
+    bench_sort([500] + sizes)
+    print()
+    bench_merge(10 ** 5, [2 ** p for p in range(1, 11)])
@@ -0,0 +1,148 @@
+from array import array
+
+NIL = -1
+
+
+class NodeView:
+    """
+    Lightweight view of a single slot in a CompactLinkedList.
+
+    Views expose the same ``data``/``next`` attributes as ``Node``, so the functions from
+    ``reverse``, ``sort`` and ``merge`` can relink a compact list without knowing about slots.
+    Assigning ``next`` writes straight into the owning list's index buffer, so a view can only be
+    linked to views of the same list; separate compact lists are merged by ``merge_compact_lists``.
+
+    :param owner: The CompactLinkedList the slot belongs to.
+    :param index: The slot index inside the owner's buffers.
+    """
+    __slots__ = ('owner', 'index')
+
+    def __init__(self, owner, index):
+        self.owner = owner
+        self.index = index
+
+    @property
+    def data(self):
+        return self.owner._data[self.index]
+
+    @data.setter
+    def data(self, value):
+        self.owner._data[self.index] = value
+
+    @property
+    def next(self):
+        return self.owner._view(self.owner._next[self.index])
+
+    @next.setter
+    def next(self, node):
+        self.owner._next[self.index] = self.owner._slot_of(node)
+        # Перелінкування могло відрізати хвіст, тож append знайде його заново
+        self.owner._tail = NIL
+
+    def __eq__(self, other):
+        return isinstance(other, NodeView) and other.owner is self.owner and other.index == self.index
+
+    def __hash__(self):
+        return hash((id(self.owner), self.index))
+
+    def __repr__(self):
+        return f"NodeView({self.data!r})"
+
+
+class CompactLinkedList:
+    """
+    CompactLinkedList
+
+    A singly linked list that keeps node payloads and links in parallel buffers indexed by slot
+    instead of allocating one ``Node`` object per element. ``data`` is a plain list, ``next`` is a
+    typed ``array('q')`` where ``-1`` marks the end of the list. A tail slot is tracked, so
+    ``append`` runs in O(1).
+
+    Methods:
+        - __init__
+        - append
+        - extend
+        - print_list
+
+    Attributes:
+        - head
+
+    """
+    def __init__(self, iterable=None):
+        self._data = []
+        self._next = array('q')
+        self._head = NIL
+        self._tail = NIL
+        if iterable is not None:
+            self.extend(iterable)
+
+    @property
+    def head(self):
+        return self._view(self._head)
+
+    @head.setter
+    def head(self, node):
+        self._head = self._slot_of(node)
+        # Після зовнішнього перелінкування (reverse, sort, merge) хвіст невідомий
+        self._tail = NIL
+
+    def _view(self, index):
+        return None if index == NIL else NodeView(self, index)
+
+    def _slot_of(self, node):
+        if node is None:
+            return NIL
+        if not isinstance(node, NodeView) or node.owner is not self:
+            raise ValueError("node does not belong to this list")
+        return node.index
+
+    def _find_tail(self):
+        index = self._head
+        if index == NIL:
+            return NIL
+        links = self._next
+        while links[index] != NIL:
+            index = links[index]
+        return index
+
+    def append(self, data):
+        index = len(self._data)
+        self._data.append(data)
+        self._next.append(NIL)
+        if self._head == NIL:
+            self._head = index
+        else:
+            if self._tail == NIL:
+                self._tail = self._find_tail()
+            self._next[self._tail] = index
+        self._tail = index
+
+    def extend(self, iterable):
+        start = len(self._data)
+        self._data.extend(iterable)
+        end = len(self._data)
+        if start == end:
+            return
+        # Нові слоти лежать підряд, тож посилання на наступний — просто i + 1
+        self._next.extend(range(start + 1, end + 1))
+        self._next[end - 1] = NIL
+        if self._head == NIL:
+            self._head = start
+        else:
+            if self._tail == NIL:
+                self._tail = self._find_tail()
+            self._next[self._tail] = start
+        self._tail = end - 1
+
+    def __iter__(self):
+        data = self._data
+        links = self._next
+        index = self._head
+        while index != NIL:
+            yield data[index]
+            index = links[index]
+
+    def print_list(self):
+        for data in self:
+            print(data, end=' -> ')
+        print('None')
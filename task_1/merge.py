@@ -1,3 +1,6 @@
+import heapq
+
+from task_1.compact_linked_list import CompactLinkedList
 from task_1.linked_list_impl import Node
 
 
@@ -27,3 +30,77 @@ def merge_sorted_lists(a, b):
         tail.next = b
 
     return dummy.next
+
+
+def iter_merge_sorted(*sources):
+    """
+    Lazily merges any number of sorted sources in ascending order using a heap.
+
+    A source is either the head node of a sorted linked list or any sorted iterable. Nodes are
+    yielded as they are (so the caller can relink them), values of plain iterables are yielded
+    directly. Each step costs O(log K) for K sources, and the consumer may stop at any time.
+    Equal values are yielded in the order of their sources, which keeps the merge stable.
+
+    :param sources: Head nodes of sorted linked lists or sorted iterables.
+    :return: A generator of nodes and values in ascending order.
+    """
+    heap = []
+    for order, source in enumerate(sources):
+        if source is None:
+            continue
+        if hasattr(source, 'data') and hasattr(source, 'next'):
+            heap.append((source.data, order, source, None))
+        else:
+            iterator = iter(source)
+            for value in iterator:
+                heap.append((value, order, value, iterator))
+                break
+    heapq.heapify(heap)
+
+    while heap:
+        value, order, item, iterator = heap[0]
+        # Наступний елемент джерела зчитуємо до yield, бо споживач може змінити item.next
+        if iterator is None:
+            successor = item.next
+            if successor is None:
+                heapq.heappop(heap)
+            else:
+                heapq.heapreplace(heap, (successor.data, order, successor, None))
+        else:
+            for successor in iterator:
+                heapq.heapreplace(heap, (successor, order, successor, iterator))
+                break
+            else:
+                heapq.heappop(heap)
+        yield item
+
+
+def merge_k_sorted_lists(heads):
+    """
+    Merges K sorted linked lists into one by relinking their nodes, without allocating new nodes.
+
+    :param heads: An iterable of head nodes of sorted linked lists.
+    :return: The head node of the merged linked list.
+    """
+    dummy = Node()
+    tail = dummy
+    for node in iter_merge_sorted(*heads):
+        tail.next = node
+        tail = node
+    tail.next = None
+    return dummy.next
+
+
+def merge_compact_lists(*lists):
+    """
+    Merges sorted CompactLinkedLists into a new CompactLinkedList.
+
+    Nodes of a compact list are slots in its own buffers, so they cannot be linked into another
+    compact list, and merge_sorted_lists or merge_k_sorted_lists only accept heads of the same list.
+    This adapter merges the values of the lists with iter_merge_sorted and stores them in the
+    buffers of a new list; the source lists are left unchanged.
+
+    :param lists: Sorted CompactLinkedLists.
+    :return: A new CompactLinkedList with all values in ascending order.
+    """
+    return CompactLinkedList(iter_merge_sorted(*lists))
@@ -60,3 +60,107 @@ def sorted_merge(a, b):
         result = b
         result.next = sorted_merge(a, b.next)
     return result
+
+
+def bottom_up_merge_sort_linked_list(head, key=None, reverse=False):
+    """
+    Sorts a linked list with an iterative, natural bottom-up merge sort.
+
+    Every pass walks the list once, cuts off pairs of adjacent already-sorted runs and merges
+    them, so the number of runs halves per pass. No recursion is used and only a constant number
+    of pointers is kept, which makes it safe for lists of millions of nodes. The sort is stable.
+
+    :param head: The head node of the linked list.
+    :param key: An optional function that extracts a comparison key from each node's data.
+    :param reverse: If True, the list is sorted in descending order.
+    :return: The head node of the sorted linked list.
+    """
+    if head is None or head.next is None:
+        return head
+
+    if key is None:
+        if reverse:
+            def in_order(a, b):
+                return a.data >= b.data
+        else:
+            def in_order(a, b):
+                return a.data <= b.data
+    elif reverse:
+        def in_order(a, b):
+            return key(a.data) >= key(b.data)
+    else:
+        def in_order(a, b):
+            return key(a.data) <= key(b.data)
+
+    while True:
+        merged_head = None
+        merged_tail = None
+        runs = 0
+        current = head
+        while current is not None:
+            left = current
+            left_end = _cut_run(left, in_order)
+            right = left_end.next
+            left_end.next = None
+            if right is None:
+                run_head, run_tail = left, left_end
+                current = None
+            else:
+                right_end = _cut_run(right, in_order)
+                current = right_end.next
+                right_end.next = None
+                run_head, run_tail = _merge_runs(left, right, in_order)
+            runs += 1
+            if merged_tail is None:
+                merged_head = run_head
+            else:
+                merged_tail.next = run_head
+            merged_tail = run_tail
+        head = merged_head
+        if runs == 1:
+            return head
+
+
+def _cut_run(start, in_order):
+    """
+    Finds the last node of the sorted run that begins at start.
+
+    :param start: The first node of the run.
+    :param in_order: A predicate telling whether two neighbouring nodes are in order.
+    :return: The last node of the run.
+    """
+    node = start
+    while node.next is not None and in_order(node, node.next):
+        node = node.next
+    return node
+
+
+def _merge_runs(a, b, in_order):
+    """
+    Iteratively merges two sorted runs, preferring nodes of the first run on ties.
+
+    :param a: The head node of the first run.
+    :param b: The head node of the second run.
+    :param in_order: A predicate telling whether two nodes are in order.
+    :return: A tuple of the head and the tail node of the merged run.
+    """
+    if in_order(a, b):
+        head = a
+        a = a.next
+    else:
+        head = b
+        b = b.next
+    tail = head
+    while a is not None and b is not None:
+        if in_order(a, b):
+            tail.next = a
+            a = a.next
+        else:
+            tail.next = b
+            b = b.next
+        tail = tail.next
+    rest = a if a is not None else b
+    tail.next = rest
+    while tail.next is not None:
+        tail = tail.next
+    return head, tail
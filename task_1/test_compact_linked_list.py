@@ -0,0 +1,47 @@
+import pytest
+
+from task_1.compact_linked_list import CompactLinkedList
+from task_1.merge import merge_compact_lists, merge_sorted_lists
+from task_1.reverse import reverse_linked_list
+from task_1.sort import merge_sort_linked_list
+
+
+def test_append_and_extend_keep_order():
+    ll = CompactLinkedList([1, 2])
+    ll.append(3)
+    ll.extend([4, 5])
+    assert list(ll) == [1, 2, 3, 4, 5]
+
+
+def test_relinking_functions_run_on_compact_list():
+    ll = CompactLinkedList([3, 1, 2])
+    ll.head = merge_sort_linked_list(ll.head)
+    assert list(ll) == [1, 2, 3]
+    reverse_linked_list(ll)
+    assert list(ll) == [3, 2, 1]
+    ll.append(0)
+    assert list(ll) == [3, 2, 1, 0]
+
+
+def test_append_after_relinking_through_a_view():
+    ll = CompactLinkedList([1, 2, 3])
+    ll.head.next.next = None
+    ll.append(4)
+    assert list(ll) == [1, 2, 4]
+
+
+def test_heads_of_separate_lists_cannot_be_relinked():
+    with pytest.raises(ValueError):
+        merge_sorted_lists(CompactLinkedList([1, 3]).head, CompactLinkedList([2]).head)
+
+
+def test_merge_separate_compact_lists():
+    a = CompactLinkedList([1, 4, 6, 9])
+    b = CompactLinkedList([2, 4, 5])
+    c = CompactLinkedList()
+    merged = merge_compact_lists(a, b, c)
+    assert isinstance(merged, CompactLinkedList)
+    assert list(merged) == [1, 2, 4, 4, 5, 6, 9]
+    assert list(a) == [1, 4, 6, 9] and list(b) == [2, 4, 5]
+    merged.append(10)
+    assert list(merged)[-1] == 10
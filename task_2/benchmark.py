@@ -0,0 +1,75 @@
+import math
+import os
+import sys
+import tempfile
+import time
+
+from task_2.pythagoras_engine import pythagoras_segments, render_segments
+from task_2.tiles import LEFT, REACH, RIGHT, TILE_SIZE, canonical_subtree, render_tile, tile_segments
+
+
+def bench_geometry(levels):
+    print(f"{'level':>6} {'segments':>10} {'time, s':>10} {'segments/s':>12}")
+    for level in levels:
+        start = time.perf_counter()
+        segments = pythagoras_segments(100, level)
+        elapsed = time.perf_counter() - start
+        print(f"{level:>6} {len(segments):>10} {elapsed:>10.4f} {len(segments) / elapsed:>12.0f}")
+
+
+def bench_render(levels):
+    print(f"{'level':>6} {'format':>6} {'time, s':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        for level in levels:
+            segments = pythagoras_segments(100, level)
+            for extension in ('png', 'svg'):
+                start = time.perf_counter()
+                render_segments(segments, os.path.join(directory, f"tree.{extension}"))
+                print(f"{level:>6} {extension:>6} {time.perf_counter() - start:>10.3f}")
+
+
+def tree_point(length=100.0, depth=90):
+    """
+    Follows a fixed left/right pattern of branches to a point deep inside the tree.
+    """
+    start, vector = 0j, length * 1j
+    for i in range(depth):
+        start += vector
+        vector *= LEFT if i % 3 else RIGHT
+    return start
+
+
+def bench_tiles(zooms, length=100.0):
+    """
+    Renders the tiles that contain the same deep point of the tree at growing zoom levels.
+
+    The last column is the number of segments the full tree would need for the same detail, which is
+    what pythagoras_segments would have to compute.
+
+    :param zooms: The zoom levels.
+    :param length: The length of the trunk.
+    """
+    point = tree_point(length)
+    radius = length * REACH
+    print(f"{'zoom':>5} {'segments':>9} {'geometry, s':>12} {'render, s':>10} {'full tree':>10}")
+    for z in zooms:
+        size = 2 * radius / 2 ** z
+        x, y = int((point.real + radius) // size), int((radius - point.imag) // size)
+        start = time.perf_counter()
+        segments = tile_segments(z, x, y, length)
+        geometry = time.perf_counter() - start
+        start = time.perf_counter()
+        render_tile(z, x, y, length=length)
+        render = time.perf_counter() - start
+        depth = int(math.log(length * TILE_SIZE / size) / math.log(math.sqrt(2)))
+        print(f"{z:>5} {len(segments):>9} {geometry:>12.4f} {render:>10.3f} {f'2^{depth + 1}':>10}")
+    print(canonical_subtree.cache_info())
+
+
+if __name__ == '__main__':
+    max_level = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    bench_geometry(range(5, max_level + 1))
+    print()
+    bench_render(range(5, min(max_level, 15) + 1, 5))
+    print()
+    bench_tiles([0, 4, 8, 16, 24, 32, 40])
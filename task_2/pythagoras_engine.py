@@ -0,0 +1,97 @@
+import math
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+
+
+def iter_levels(length, level, origin=(0.0, 0.0), heading=90.0):
+    """
+    Computes the pythagoras tree level by level without recursion.
+
+    Every level is described by two arrays: the start points and the direction vectors (already
+    scaled to the segment length) of all its segments. A branch turns 45 degrees left or right
+    and shrinks by sqrt(2), which for a vector (x, y) gives the children ((x - y) / 2, (x + y) / 2)
+    and ((x + y) / 2, (y - x) / 2), so no trigonometry is needed after the trunk.
+
+    :param length: The length of the trunk.
+    :param level: The level of recursion, as in draw_pythagoras_tree (level 0 is just the trunk).
+    :param origin: The (x, y) start point of the trunk.
+    :param heading: The direction of the trunk in degrees.
+    :return: A generator of (starts, vectors) arrays of shape (2 ** depth, 2) for depth 0..level.
+    """
+    angle = math.radians(heading)
+    starts = np.array([origin], dtype=np.float64)
+    vectors = np.array([[length * math.cos(angle), length * math.sin(angle)]])
+    for depth in range(level + 1):
+        yield starts, vectors
+        if depth == level:
+            return
+        ends = starts + vectors
+        x, y = vectors[:, 0], vectors[:, 1]
+        children = np.empty((2 * len(vectors), 2))
+        # Парні індекси — ліві гілки, непарні — праві, як у порядку обходу turtle
+        children[0::2, 0] = (x - y) / 2
+        children[0::2, 1] = (x + y) / 2
+        children[1::2, 0] = (x + y) / 2
+        children[1::2, 1] = (y - x) / 2
+        starts = np.repeat(ends, 2, axis=0)
+        vectors = children
+
+
+def pythagoras_segments(length, level, origin=(0.0, 0.0), heading=90.0):
+    """
+    Computes every segment of the pythagoras tree.
+
+    :param length: The length of the trunk.
+    :param level: The level of recursion, as in draw_pythagoras_tree.
+    :param origin: The (x, y) start point of the trunk.
+    :param heading: The direction of the trunk in degrees.
+    :return: An array of shape (2 ** (level + 1) - 1, 2, 2) with the start and end point of every segment,
+             ordered level by level.
+    """
+    segments = np.empty((2 ** (level + 1) - 1, 2, 2))
+    offset = 0
+    for starts, vectors in iter_levels(length, level, origin, heading):
+        count = len(starts)
+        segments[offset:offset + count, 0] = starts
+        segments[offset:offset + count, 1] = starts + vectors
+        offset += count
+    return segments
+
+
+def render_segments(segments, path, size=8, dpi=100, color="saddlebrown", linewidth=0.5):
+    """
+    Renders segments to an image file without a display.
+
+    The figure is drawn by the Agg backend directly, so it works on headless machines. The output
+    format (PNG, SVG, PDF, ...) is picked from the file extension.
+
+    :param segments: An array of shape (N, 2, 2) as returned by pythagoras_segments.
+    :param path: The output file path.
+    :param size: The figure size in inches.
+    :param dpi: The resolution of raster output.
+    :param color: The line color.
+    :param linewidth: The line width in points.
+    :return: None
+    """
+    figure = Figure(figsize=(size, size), dpi=dpi)
+    FigureCanvasAgg(figure)
+    ax = figure.add_axes((0, 0, 1, 1))
+    ax.add_collection(LineCollection(segments, colors=color, linewidths=linewidth))
+    ax.set_aspect('equal')
+    ax.autoscale_view()
+    ax.axis('off')
+    figure.savefig(path)
+
+
+def main():
+    level = int(input("Вкажіть рівень рекурсії: "))
+    path = f"pythagoras_tree_{level}.png"
+    render_segments(pythagoras_segments(100, level), path)
+    print(f"Дерево Піфагора збережено у {path}")
+
+
+if __name__ == "__main__":
+    main()
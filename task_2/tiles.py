@@ -0,0 +1,174 @@
+import math
+from functools import lru_cache
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+
+SHRINK = 1 / math.sqrt(2)
+# Піддерево зі стовбуром довжини L цілком лежить у колі радіуса L / (1 - 1/sqrt(2)) навколо початку стовбура
+REACH = 1 / (1 - SHRINK)
+# Повороти гілок на 45 градусів зі зменшенням у sqrt(2) разів як множення на комплексне число
+LEFT = (1 + 1j) / 2
+RIGHT = (1 - 1j) / 2
+
+INSTANCE_DEPTH = 10
+SUBTREE_CACHE_SIZE = 32
+TILE_SIZE = 256
+MAX_ZOOM = 40
+
+
+@lru_cache(maxsize=SUBTREE_CACHE_SIZE)
+def canonical_subtree(depth):
+    """
+    Computes the tree with a unit trunk from 0 to 1j (complex coordinates) and depth levels of branches.
+
+    Both branches of a tree are the tree one level shallower, turned by 45 degrees and shrunk by
+    sqrt(2), so the depth-k tree is built from the cached depth-(k - 1) tree with two complex
+    multiplications instead of being traversed again. The results are kept in an LRU cache.
+
+    :param depth: The number of branch levels, as the level of draw_pythagoras_tree.
+    :return: A tuple of read-only complex arrays (starts, vectors) of 2 ** (depth + 1) - 1 segments.
+    """
+    if depth == 0:
+        starts, vectors = np.array([0j]), np.array([1j])
+    else:
+        child_starts, child_vectors = canonical_subtree(depth - 1)
+        starts = np.concatenate(([0j], 1j + LEFT * child_starts, 1j + RIGHT * child_starts))
+        vectors = np.concatenate(([1j], LEFT * child_vectors, RIGHT * child_vectors))
+    starts.setflags(write=False)
+    vectors.setflags(write=False)
+    return starts, vectors
+
+
+def tile_bounds(z, x, y, length=100.0):
+    """
+    Returns the world rectangle of a map-style tile.
+
+    Zoom level 0 is a single tile: the square around the bounding circle of the whole tree, whose
+    trunk of the given length starts at the origin and points up. Every zoom level splits each tile
+    into four; x grows to the right and y grows downwards.
+
+    :param z: The zoom level.
+    :param x: The tile column, 0..2 ** z - 1.
+    :param y: The tile row, 0..2 ** z - 1.
+    :param length: The length of the trunk.
+    :return: A tuple (x_min, y_min, x_max, y_max).
+    """
+    if not 0 <= z <= MAX_ZOOM:
+        raise ValueError(f"Zoom level must be between 0 and {MAX_ZOOM}, beyond it double precision runs out")
+    if not (0 <= x < 2 ** z and 0 <= y < 2 ** z):
+        raise ValueError(f"No tile {x}, {y} at zoom level {z}")
+    radius = length * REACH
+    size = 2 * radius / 2 ** z
+    return -radius + x * size, radius - (y + 1) * size, -radius + (x + 1) * size, radius - y * size
+
+
+def visible_segments(bounds, pixel, length=100.0, instance_depth=INSTANCE_DEPTH):
+    """
+    Computes the segments of the tree that can show up in a rectangle, down to the pixel size.
+
+    The tree is walked level by level like iter_levels, but every level keeps only the branches
+    whose bounding circle meets the rectangle. Once the branches left are at most instance_depth
+    levels above the pixel limit, their subtrees are not walked any further: the cached canonical
+    subtree of that depth is placed at every branch by one affine transform (a complex multiply and
+    add). The work and the memory per tile therefore depend on the tile's pixels, not on the depth.
+
+    :param bounds: The rectangle (x_min, y_min, x_max, y_max).
+    :param pixel: The size of a pixel in world units; shorter branches are not drawn.
+    :param length: The length of the trunk.
+    :param instance_depth: The deepest canonical subtree to place at once.
+    :return: An array of shape (N, 2, 2) with the start and end point of every segment.
+    """
+    x_min, y_min, x_max, y_max = bounds
+    starts, vectors = np.array([0j]), np.array([length * 1j])
+    parts = []
+    while len(starts):
+        branch = abs(vectors[0])
+        if branch < pixel:
+            break
+        # Відстань від центру кола до прямокутника; гілки, чиє коло його не зачіпає, відкидаємо
+        dx = np.maximum(np.maximum(x_min - starts.real, starts.real - x_max), 0)
+        dy = np.maximum(np.maximum(y_min - starts.imag, starts.imag - y_max), 0)
+        keep = dx * dx + dy * dy <= (branch * REACH) ** 2
+        starts, vectors = starts[keep], vectors[keep]
+
+        depth = int(math.log(branch / pixel) / math.log(math.sqrt(2)))
+        if depth <= instance_depth:
+            canonical_starts, canonical_vectors = canonical_subtree(depth)
+            scale = -1j * vectors[:, None]
+            parts.append(((starts[:, None] + scale * canonical_starts).ravel(), (scale * canonical_vectors).ravel()))
+            break
+        parts.append((starts, vectors))
+        ends = starts + vectors
+        starts = np.repeat(ends, 2)
+        vectors = np.stack((LEFT * vectors, RIGHT * vectors), axis=1).ravel()
+
+    if not parts:
+        return np.empty((0, 2, 2))
+    starts = np.concatenate([part[0] for part in parts])
+    ends = starts + np.concatenate([part[1] for part in parts])
+    # Відкидаємо відрізки, чия обмежувальна рамка не перетинає прямокутник
+    keep = ((np.minimum(starts.real, ends.real) <= x_max) & (np.maximum(starts.real, ends.real) >= x_min)
+            & (np.minimum(starts.imag, ends.imag) <= y_max) & (np.maximum(starts.imag, ends.imag) >= y_min))
+    starts, ends = starts[keep], ends[keep]
+    segments = np.empty((len(starts), 2, 2))
+    segments[:, 0, 0], segments[:, 0, 1] = starts.real, starts.imag
+    segments[:, 1, 0], segments[:, 1, 1] = ends.real, ends.imag
+    return segments
+
+
+def tile_segments(z, x, y, length=100.0, tile_size=TILE_SIZE):
+    """
+    Computes the segments drawn on a map-style tile.
+
+    :param z: The zoom level.
+    :param x: The tile column.
+    :param y: The tile row.
+    :param length: The length of the trunk.
+    :param tile_size: The width and height of the tile in pixels.
+    :return: An array of shape (N, 2, 2) with the start and end point of every segment.
+    """
+    bounds = tile_bounds(z, x, y, length)
+    return visible_segments(bounds, (bounds[2] - bounds[0]) / tile_size, length)
+
+
+def render_tile(z, x, y, path=None, length=100.0, tile_size=TILE_SIZE, color="saddlebrown", linewidth=0.5):
+    """
+    Renders a map-style tile of the pythagoras tree without a display.
+
+    :param z: The zoom level.
+    :param x: The tile column.
+    :param y: The tile row.
+    :param path: The output image file; if None, the pixels are returned instead.
+    :param length: The length of the trunk.
+    :param tile_size: The width and height of the tile in pixels.
+    :param color: The line color.
+    :param linewidth: The line width in points.
+    :return: None if path is given, otherwise an RGBA uint8 array of shape (tile_size, tile_size, 4).
+    """
+    x_min, y_min, x_max, y_max = tile_bounds(z, x, y, length)
+    figure = Figure(figsize=(tile_size / 100, tile_size / 100), dpi=100)
+    canvas = FigureCanvasAgg(figure)
+    ax = figure.add_axes((0, 0, 1, 1))
+    ax.add_collection(LineCollection(tile_segments(z, x, y, length, tile_size), colors=color, linewidths=linewidth))
+    ax.set_xlim(x_min, x_max)
+    ax.set_ylim(y_min, y_max)
+    ax.axis('off')
+    if path is not None:
+        figure.savefig(path)
+        return None
+    canvas.draw()
+    return np.asarray(canvas.buffer_rgba()).copy()
+
+
+def main():
+    z, x, y = map(int, input("Вкажіть тайл (z x y): ").split())
+    path = f"pythagoras_tile_{z}_{x}_{y}.png"
+    render_tile(z, x, y, path)
+    print(f"Тайл збережено у {path}")
+
+
+if __name__ == "__main__":
+    main()
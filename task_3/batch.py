@@ -0,0 +1,140 @@
+import os
+from array import array
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from task_3.csr import CSRGraph
+
+# Граф воркера: CSR-масиви поверх спільної пам'яті, підключені один раз в initializer
+_worker_graph = None
+_worker_blocks = []
+
+
+def _share(buffer):
+    """
+    Copies a typed array into a new shared memory block.
+
+    :param buffer: an array.array to share
+    :return: a tuple of the SharedMemory block and a (name, typecode, length) descriptor for workers
+    """
+    nbytes = max(1, len(buffer) * buffer.itemsize)
+    block = shared_memory.SharedMemory(create=True, size=nbytes)
+    block.buf[:len(buffer) * buffer.itemsize] = buffer.tobytes()
+    return block, (block.name, buffer.typecode, len(buffer))
+
+
+def _attach(descriptor):
+    name, typecode, length = descriptor
+    block = shared_memory.SharedMemory(name=name)
+    _worker_blocks.append(block)
+    itemsize = array(typecode).itemsize
+    return block.buf[:length * itemsize].cast(typecode)
+
+
+def _init_worker(descriptors):
+    global _worker_graph
+    _worker_graph = CSRGraph(*(_attach(descriptor) for descriptor in descriptors))
+
+
+def solve_sources(sources):
+    """
+    Computes distance rows inside a worker of worker_pool.
+
+    :param sources: a list of source vertices
+    :return: a list of array('d') distance rows
+    """
+    return [_worker_graph.dijkstra(src) for src in sources]
+
+
+@contextmanager
+def worker_pool(csr, workers):
+    """
+    Starts a process pool whose workers share the CSR arrays instead of receiving copies.
+
+    The arrays are copied once into shared memory blocks, every worker attaches them in its
+    initializer, and the blocks are unlinked when the pool is closed. Submit solve_sources to the
+    yielded executor to compute distance rows.
+
+    :param csr: the CSRGraph to share
+    :param workers: the number of worker processes
+    :return: a context manager yielding the ProcessPoolExecutor
+    """
+    shared = [_share(buffer) for buffer in (csr.offsets, csr.targets, csr.weights)]
+    try:
+        descriptors = [descriptor for _, descriptor in shared]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(descriptors,)) as executor:
+            yield executor
+    finally:
+        for block, _ in shared:
+            block.close()
+            block.unlink()
+
+
+def iter_distance_rows(csr, sources, workers=None, chunk_size=64):
+    """
+    Computes single-source distance rows for many sources, yielding them chunk by chunk.
+
+    The CSR arrays are copied once into shared memory and attached by every worker process, so
+    the graph is never pickled per task. At most two chunks per worker are in flight at a time,
+    which keeps memory bounded even for very large distance tables.
+
+    :param csr: the CSRGraph to query
+    :param sources: an iterable of source vertices
+    :param workers: the number of worker processes (default: os.cpu_count()); 1 runs in-process
+    :param chunk_size: the number of sources per task
+    :return: a generator of (chunk_sources, rows) tuples, where rows are array('d') distance rows
+    """
+    sources = list(sources)
+    chunks = [sources[i:i + chunk_size] for i in range(0, len(sources), chunk_size)]
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            yield chunk, [csr.dijkstra(src) for src in chunk]
+        return
+
+    with worker_pool(csr, workers) as executor:
+        pending = deque()
+        chunks_iter = iter(chunks)
+        for chunk in chunks_iter:
+            pending.append((chunk, executor.submit(solve_sources, chunk)))
+            if len(pending) >= 2 * workers:
+                break
+        while pending:
+            chunk, future = pending.popleft()
+            for next_chunk in chunks_iter:
+                pending.append((next_chunk, executor.submit(solve_sources, next_chunk)))
+                break
+            yield chunk, future.result()
+
+
+def distance_matrix(csr, sources, workers=None, chunk_size=64, as_numpy=False):
+    """
+    Computes the full distance table from the given sources to all vertices.
+
+    :param csr: the CSRGraph to query
+    :param sources: an iterable of source vertices
+    :param workers: the number of worker processes (default: os.cpu_count())
+    :param chunk_size: the number of sources per task
+    :param as_numpy: if True, return a numpy.ndarray of shape (len(sources), V)
+    :return: a list of array('d') rows, or a numpy array if as_numpy is True
+    """
+    sources = list(sources)
+    if as_numpy:
+        import numpy as np
+
+        matrix = np.empty((len(sources), csr.V), dtype=np.float64)
+        row_index = 0
+        for _, rows in iter_distance_rows(csr, sources, workers, chunk_size):
+            for row in rows:
+                matrix[row_index] = np.frombuffer(row, dtype=np.float64)
+                row_index += 1
+        return matrix
+
+    matrix = []
+    for _, rows in iter_distance_rows(csr, sources, workers, chunk_size):
+        matrix.extend(rows)
+    return matrix
@@ -0,0 +1,313 @@
+import math
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from task_3.dijkstra import Graph, euclidean_heuristic
+from task_3.queues import QUEUES, select_queue
+
+
+def random_graph(vertices, degree=4, max_weight=100, seed=0):
+    """
+    Builds a connected random graph: a random spanning path plus random extra edges.
+
+    :param vertices: The number of vertices.
+    :param degree: The average number of edges added per vertex.
+    :param max_weight: The maximal integer edge weight.
+    :param seed: The random seed.
+    :return: The Graph instance.
+    """
+    rnd = random.Random(seed)
+    graph = Graph(vertices)
+    order = list(range(vertices))
+    rnd.shuffle(order)
+    for u, v in zip(order, order[1:]):
+        graph.add_edge(u, v, rnd.randint(1, max_weight))
+    for _ in range(vertices * (degree - 1) // 2):
+        graph.add_edge(rnd.randrange(vertices), rnd.randrange(vertices), rnd.randint(1, max_weight))
+    return graph
+
+
+def grid_graph(side, seed=0):
+    """
+    Builds a side x side grid graph with weights not smaller than the Euclidean distance between cells.
+
+    :param side: The number of vertices along one side.
+    :param seed: The random seed.
+    :return: A tuple of the Graph instance and the vertex coordinates.
+    """
+    rnd = random.Random(seed)
+    graph = Graph(side * side)
+    coords = {}
+    for row in range(side):
+        for col in range(side):
+            v = row * side + col
+            coords[v] = (col, row)
+            if col + 1 < side:
+                graph.add_edge(v, v + 1, 1 + rnd.random())
+            if row + 1 < side:
+                graph.add_edge(v, v + side, 1 + rnd.random())
+    return graph, coords
+
+
+def bench_point_to_point(name, graph, pairs, coords=None):
+    modes = [("full dijkstra", None), ("dijkstra", 'dijkstra'), ("bidirectional", 'bidirectional')]
+    if coords is not None:
+        modes.append(("astar", 'astar'))
+    print(f"{name}: {graph.V} вершин, {len(pairs)} запитів")
+    print(f"{'mode':<16} {'avg settled':>12} {'queries/s':>10}")
+    for label, method in modes:
+        settled = 0
+        start = time.perf_counter()
+        for src, dst in pairs:
+            if method is None:
+                graph.dijkstra(src)
+                settled += graph.V
+                continue
+            stats = {}
+            heuristic = euclidean_heuristic(coords, dst) if method == 'astar' else None
+            graph.shortest_path(src, dst, method=method, heuristic=heuristic, stats=stats)
+            settled += stats['settled']
+        elapsed = time.perf_counter() - start
+        print(f"{label:<16} {settled / len(pairs):>12.0f} {len(pairs) / elapsed:>10.1f}")
+    print()
+
+
+def traced(build):
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def bench_csr(edge_counts, queries=5, degree=10):
+    """
+    Compares memory per edge and queries per second of the dict-based Graph and its CSR form.
+
+    :param edge_counts: The approximate numbers of undirected edges to try.
+    :param queries: The number of single-source queries per measurement.
+    :param degree: The average vertex degree.
+    """
+    print(f"{'edges':>10} {'layout':<8} {'B/edge':>8} {'queries/s':>10}")
+    rnd = random.Random(2)
+    for edges in edge_counts:
+        vertices = max(2, 2 * edges // degree)
+        graph, graph_bytes = traced(lambda: random_graph(vertices, degree=degree))
+        csr, csr_bytes = traced(graph.to_csr)
+        sources = [rnd.randrange(vertices) for _ in range(queries)]
+        directed_edges = csr.E
+        for name, engine, size in (("dict", graph, graph_bytes), ("csr", csr, csr_bytes)):
+            start = time.perf_counter()
+            for src in sources:
+                engine.dijkstra(src)
+            elapsed = time.perf_counter() - start
+            print(f"{edges:>10} {name:<8} {size / directed_edges:>8.1f} {queries / elapsed:>10.2f}")
+
+
+def bench_batch(vertices, sources_count=64, chunk_size=4):
+    """
+    Reports how the multi-source distance table scales with the number of worker processes.
+
+    :param vertices: The number of vertices of the random graph.
+    :param sources_count: The number of sources in the table.
+    :param chunk_size: The number of sources per task.
+    """
+    graph = random_graph(vertices)
+    sources = list(range(sources_count))
+    print(f"{'workers':>8} {'time, s':>10} {'speedup':>8}")
+    baseline = None
+    for workers in range(1, (os.cpu_count() or 1) + 1):
+        start = time.perf_counter()
+        for _ in graph.iter_distance_rows(sources, workers=workers, chunk_size=chunk_size):
+            pass
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"{workers:>8} {elapsed:>10.3f} {baseline / elapsed:>8.2f}")
+
+
+def bench_dynamic(vertices, updates=200, seed=3):
+    """
+    Compares incremental tree repair with recomputing Dijkstra from scratch after every edge update.
+
+    :param vertices: The number of vertices of the random graph.
+    :param updates: The number of random weight updates.
+    :param seed: The random seed.
+    """
+    rnd = random.Random(seed)
+    graph = random_graph(vertices)
+    changes = []
+    for _ in range(updates):
+        u = rnd.randrange(vertices)
+        v = rnd.choice(graph.graph[u])[0]
+        changes.append((u, v, rnd.randint(1, 100)))
+
+    print(f"{'mode':<12} {'updates/s':>10}")
+    for mode in ("recompute", "repair"):
+        current = random_graph(vertices)
+        if mode == "repair":
+            current.enable_cache(maxsize=1)
+        current.shortest_path_tree(0)
+        start = time.perf_counter()
+        for u, v, w in changes:
+            current.update_edge(u, v, w)
+            if mode == "recompute":
+                current.shortest_path_tree(0)
+        elapsed = time.perf_counter() - start
+        print(f"{mode:<12} {updates / elapsed:>10.1f}")
+
+
+def travel_time_grid(side, seed=0):
+    """
+    Builds a side x side grid graph with integer travel times of 30..90 seconds per edge.
+
+    :param side: The number of vertices along one side.
+    :param seed: The random seed.
+    :return: The Graph instance.
+    """
+    rnd = random.Random(seed)
+    graph = Graph(side * side)
+    for row in range(side):
+        for col in range(side):
+            v = row * side + col
+            if col + 1 < side:
+                graph.add_edge(v, v + 1, rnd.randint(30, 90))
+            if row + 1 < side:
+                graph.add_edge(v, v + side, rnd.randint(30, 90))
+    return graph
+
+
+def bench_queues(sizes, sources=3, repeat=3):
+    """
+    Runs Dijkstra with every priority queue backend over several graph families and sizes.
+
+    The integer-only backends are skipped on graphs with fractional weights. The backend picked by
+    queue='auto' is marked with an asterisk, and the 'auto' row times dijkstra(queue='auto') itself,
+    so the speedup column shows that it never loses to the default heapq.
+
+    :param sizes: The numbers of vertices.
+    :param sources: The number of source vertices per measurement.
+    :param repeat: The number of measurements per queue; the fastest one is reported.
+    """
+    families = [
+        ("random, w<=10", lambda n: random_graph(n, max_weight=10)),
+        ("random, w<=100", lambda n: random_graph(n)),
+        ("random, w<=10^6", lambda n: random_graph(n, max_weight=10 ** 6)),
+        ("grid, seconds", lambda n: travel_time_grid(int(n ** 0.5))),
+        ("grid, float", lambda n: grid_graph(int(n ** 0.5))[0]),
+    ]
+    print(f"{'family':<16} {'V':>7} {'queue':<9} {'ms/query':>9} {'vs heapq':>9} {'pushes':>8} {'pops':>8} "
+          f"{'stale':>8}")
+    for name, build in families:
+        for size in sizes:
+            graph = build(size)
+            integer_weights, max_weight = graph.weight_profile()
+            auto = select_queue(integer_weights, max_weight, graph.V)
+            baseline = None
+            for queue in QUEUES + ('auto',):
+                if queue in ('dial', 'radix') and not integer_weights:
+                    continue
+                stats = {}
+                elapsed = math.inf
+                # Найкращий із кількох повторів, щоб шум не переважив різницю між чергами
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    for src in range(sources):
+                        graph.dijkstra(src, queue=queue, stats=stats)
+                    elapsed = min(elapsed, (time.perf_counter() - start) / sources)
+                baseline = baseline or elapsed
+                label = queue + ('*' if queue == auto else '')
+                print(f"{name:<16} {graph.V:>7} {label:<9} {elapsed * 1000:>9.1f} {baseline / elapsed:>9.2f} "
+                      f"{stats['pushes']:>8} {stats['pops']:>8} {stats['stale']:>8}")
+
+
+# ru_maxrss переживає exec на Linux, тому пік пам'яті читаємо з VmHWM нового процесу
+LOAD_SCRIPT = """
+import sys, time
+from task_3.dijkstra import Graph
+from task_3.loader import load_edge_list, load_snapshot
+
+def load_add_edge(path, vertices):
+    graph = Graph(vertices)
+    with open(path) as f:
+        for line in f:
+            u, v, w = line.split()
+            graph.add_edge(int(u), int(v), float(w))
+    return graph.to_csr()
+
+start = time.perf_counter()
+if sys.argv[1] == 'add_edge':
+    csr = load_add_edge(sys.argv[2], int(sys.argv[3]))
+elif sys.argv[1] == 'text':
+    csr = load_edge_list(sys.argv[2])
+else:
+    csr = load_snapshot(sys.argv[2])
+loaded = time.perf_counter() - start
+csr.dijkstra(0)
+with open('/proc/self/status') as f:
+    peak_kb = next(line.split()[1] for line in f if line.startswith('VmHWM'))
+print(loaded, time.perf_counter() - start - loaded, peak_kb)
+"""
+
+
+def bench_loading(edges, seed=4):
+    """
+    Compares loading a text edge list edge by edge with Graph.add_edge, with the bulk loader, and
+    memory-mapping a binary snapshot of the same graph. The speedup is relative to add_edge.
+
+    Each load runs in a fresh interpreter so that the peak RSS of one mode does not leak into the other.
+
+    :param edges: The number of edges in the generated file.
+    :param seed: The random seed.
+    """
+    from task_3.loader import load_edge_list, save_snapshot
+
+    rnd = random.Random(seed)
+    vertices = max(2, edges // 5)
+    with tempfile.TemporaryDirectory() as directory:
+        text_path = f"{directory}/edges.txt"
+        snapshot_path = f"{directory}/edges.csr"
+        with open(text_path, 'w') as f:
+            for _ in range(edges):
+                f.write(f"{rnd.randrange(vertices)} {rnd.randrange(vertices)} {rnd.randint(1, 100)}\n")
+        save_snapshot(load_edge_list(text_path, vertices), snapshot_path)
+
+        print(f"{'edges':>10} {'source':<10} {'load, s':>10} {'speedup':>8} {'query, s':>10} {'peak RSS, MB':>13}")
+        baseline = None
+        for mode, path in (('add_edge', text_path), ('text', text_path), ('snapshot', snapshot_path)):
+            output = subprocess.run([sys.executable, '-c', LOAD_SCRIPT, mode, path, str(vertices)],
+                                    capture_output=True, text=True, check=True).stdout
+            loaded, query, peak_kb = output.split()
+            baseline = baseline or float(loaded)
+            print(f"{edges:>10} {mode:<10} {float(loaded):>10.3f} {baseline / float(loaded):>8.1f} "
+                  f"{float(query):>10.3f} {int(peak_kb) / 1024:>13.1f}")
+
+
+if __name__ == '__main__':
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    vertices = int(args[0]) if args else 100000
+    queries = 20
+    rnd = random.Random(1)
+
+    graph = random_graph(vertices)
+    pairs = [(rnd.randrange(vertices), rnd.randrange(vertices)) for _ in range(queries)]
+    bench_point_to_point("Випадковий граф", graph, pairs)
+
+    side = int(vertices ** 0.5)
+    grid, coords = grid_graph(side)
+    pairs = [(rnd.randrange(side * side), rnd.randrange(side * side)) for _ in range(queries)]
+    bench_point_to_point("Сітка", grid, pairs, coords)
+
+    bench_csr([10 ** 5, 10 ** 6] + ([10 ** 7] if '--huge' in sys.argv else []))
+    print()
+    bench_batch(vertices // 10)
+    print()
+    bench_dynamic(vertices)
+    print()
+    bench_loading(vertices * 10)
+    print()
+    bench_queues([10 ** 4, vertices])
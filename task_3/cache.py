@@ -0,0 +1,82 @@
+from collections import OrderedDict, namedtuple
+
+from task_3.dynamic import repair_decrease, repair_increase
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'repairs', 'invalidations', 'maxsize', 'currsize'])
+
+
+class ShortestPathCache:
+    """
+
+    :class: ShortestPathCache
+
+    An LRU cache of shortest-path trees keyed by source vertex. Each entry holds the distances and
+    the predecessors computed by Dijkstra's algorithm. When an edge is added or its weight changes,
+    entries that the change cannot affect are left as they are; the others are either repaired in
+    place (only the affected vertices are touched) or evicted.
+
+    :ivar maxsize: the maximal number of cached sources, None for an unbounded cache
+    :ivar repair: whether trees are repaired incrementally instead of being evicted
+
+    """
+    def __init__(self, maxsize=128, repair=True):
+        self.maxsize = maxsize
+        self.repair = repair
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.repairs = 0
+        self.invalidations = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, src):
+        entry = self._entries.get(src)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(src)
+        self.hits += 1
+        return entry
+
+    def put(self, src, distances, predecessors):
+        self._entries[src] = (distances, predecessors)
+        self._entries.move_to_end(src)
+        if self.maxsize is not None and len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def info(self):
+        return CacheInfo(self.hits, self.misses, self.repairs, self.invalidations, self.maxsize, len(self._entries))
+
+    def edge_changed(self, adjacency, u, v, old_weight, new_weight):
+        """
+        Brings every cached tree up to date after the weight of the undirected edge (u, v) changed.
+
+        :param adjacency: the graph adjacency dictionary that already reflects the change
+        :param old_weight: the previous weight, float('inf') for a new edge
+        :param new_weight: the new weight, float('inf') for a removed edge
+        """
+        for src in list(self._entries):
+            distances, predecessors = self._entries[src]
+            if new_weight < old_weight:
+                if distances[u] + new_weight >= distances[v] and distances[v] + new_weight >= distances[u]:
+                    continue
+            elif new_weight > old_weight:
+                if predecessors[v] != u and predecessors[u] != v:
+                    continue
+            else:
+                continue
+
+            if not self.repair:
+                del self._entries[src]
+                self.invalidations += 1
+            elif new_weight < old_weight:
+                repair_decrease(adjacency, distances, predecessors, u, v, new_weight)
+                self.repairs += 1
+            else:
+                repair_increase(adjacency, distances, predecessors, u, v)
+                self.repairs += 1
@@ -0,0 +1,83 @@
+import math
+from array import array
+
+from task_3.indexed_heap import IndexedHeap
+
+
+class CSRGraph:
+    """
+
+    :class: CSRGraph
+
+    This class represents a read-only graph in compressed sparse row (CSR) form. The neighbours of
+    vertex u are targets[offsets[u]:offsets[u + 1]] with the matching weights. All three buffers are
+    flat typed arrays (or any buffer supporting integer indexing, e.g. a memoryview), which makes
+    the graph cheap to store, share and snapshot.
+
+    :ivar V: an integer representing the number of vertices in the graph
+    :ivar offsets: an array of V + 1 integers with the start of every vertex's edge range
+    :ivar targets: an array of integers with the target vertex of every edge
+    :ivar weights: an array of floats with the weight of every edge
+    :ivar mapping: the memory-mapped file backing the arrays, if the graph was loaded from a snapshot
+
+    :func dijkstra(self, src):
+        Finds the distances from src to all vertices using an indexed heap with decrease-key.
+
+        :param src: an integer representing the source vertex
+        :return: an array('d') of distances indexed by vertex, float('inf') for unreachable vertices
+
+    """
+    def __init__(self, offsets, targets, weights, mapping=None):
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.mapping = mapping
+        self.V = len(offsets) - 1
+
+    @property
+    def E(self):
+        return len(self.targets)
+
+    def neighbors(self, u):
+        start, end = self.offsets[u], self.offsets[u + 1]
+        return zip(self.targets[start:end], self.weights[start:end])
+
+    def nbytes(self):
+        return sum(len(buffer) * buffer.itemsize for buffer in (self.offsets, self.targets, self.weights))
+
+    def dijkstra(self, src):
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        distances = array('d', [math.inf]) * self.V
+        distances[src] = 0.0
+        heap = IndexedHeap(self.V)
+        heap.push(src, 0.0)
+
+        while heap:
+            dist, current_vertex = heap.pop()
+            for edge in range(offsets[current_vertex], offsets[current_vertex + 1]):
+                neighbor = targets[edge]
+                distance = dist + weights[edge]
+                if distance < distances[neighbor]:
+                    distances[neighbor] = distance
+                    heap.push(neighbor, distance)
+
+        return distances
+
+
+def graph_to_csr(adjacency, vertices):
+    """
+    Converts an adjacency dictionary into a CSRGraph.
+
+    :param adjacency: a dictionary mapping every vertex 0..vertices-1 to a list of (neighbor, weight) tuples
+    :param vertices: the number of vertices
+    :return: the CSRGraph instance
+    """
+    offsets = array('q', [0]) * (vertices + 1)
+    targets = array('q')
+    weights = array('d')
+    for u in range(vertices):
+        edges = adjacency[u]
+        targets.extend(v for v, _ in edges)
+        weights.extend(w for _, w in edges)
+        offsets[u + 1] = len(targets)
+    return CSRGraph(offsets, targets, weights)
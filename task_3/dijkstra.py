@@ -1,4 +1,12 @@
 import heapq
+import math
+from collections import Counter
+
+from task_3 import batch
+from task_3.cache import ShortestPathCache
+from task_3.csr import graph_to_csr
+from task_3.dynamic import edge_weight
+from task_3.queues import is_integer_weight, make_queue, select_queue
 
 
 class Graph:
@@ -23,31 +31,184 @@ class Graph:
         :param v: an integer representing the second vertex
         :param w: a numeric value representing the weight of the edge
 
-    :func dijkstra(self, src):
+    :func remove_edge(self, u, v):
+        Removes the edge (and any parallel edges) between two vertices.
+
+        :param u: an integer representing the first vertex
+        :param v: an integer representing the second vertex
+        :raises ValueError: if the vertices are not adjacent
+
+    :func update_edge(self, u, v, w):
+        Replaces the edge (and any parallel edges) between two vertices with a single edge of the given weight.
+
+        :param u: an integer representing the first vertex
+        :param v: an integer representing the second vertex
+        :param w: a numeric value representing the new weight of the edge
+        :raises ValueError: if the vertices are not adjacent
+
+    :func dijkstra(self, src, queue='heapq', stats=None):
         Finds the shortest path from a given source vertex to all other vertices using Dijkstra's algorithm.
 
         :param src: an integer representing the source vertex
+        :param queue: the priority queue from task_3.queues: 'heapq', 'indexed', 'dial', 'radix', or 'auto' to pick
+                      one with select_queue from the type and the range of the current edge weights
+        :param stats: an optional dictionary that receives the chosen queue under 'queue' and its 'pushes', 'pops'
+                      and 'stale' counters
         :return: a dictionary of the distances from the source vertex to all other vertices, where the keys are the vertices and the values are the corresponding distances
+        :raises ValueError: if queue or stats is given while the cache is on, since cached trees are not recomputed
+
+    :func weight_profile(self):
+        Describes the edge weights seen by add_edge and update_edge, as used by queue='auto'.
+
+        :return: a tuple of whether all weights are non-negative integers and the largest weight (0 without edges)
+
+    :func shortest_path_tree(self, src):
+        Same as dijkstra, but also returns the predecessor of every reachable vertex.
+
+        :param src: an integer representing the source vertex
+        :return: a tuple of the distances dictionary and the predecessors dictionary (None for src and unreachable vertices)
+
+    :func enable_cache(self, maxsize=128, repair=True):
+        Turns on an LRU cache of shortest-path trees used by dijkstra and shortest_path_tree. When add_edge,
+        remove_edge or update_edge affect a cached tree, the tree is repaired incrementally (or evicted if repair is False).
+
+        :param maxsize: the maximal number of cached sources, None for an unbounded cache
+        :param repair: whether to repair cached trees instead of evicting them
+
+    :func disable_cache(self):
+        Turns the cache off and drops all cached trees.
+
+    :func cache_info(self):
+        :return: a CacheInfo named tuple with hits, misses, repairs, invalidations, maxsize and currsize, or None if caching is off
+
+    :func to_csr(self):
+        Builds a compressed sparse row copy of the graph.
+
+        :return: a CSRGraph with typed offsets, targets and weights arrays
+
+    :func freeze(self):
+        Same as to_csr, but the CSR copy is kept on the graph and reused until the graph changes.
+
+        :return: the cached CSRGraph
+
+    :func distance_matrix(self, sources, workers=None, chunk_size=64, as_numpy=False):
+        Computes distances from many sources at once over a process pool that shares the frozen CSR graph.
+
+        :param sources: a list of source vertices
+        :param workers: the number of worker processes (default: the number of CPUs)
+        :param chunk_size: the number of sources handed to a worker per task
+        :param as_numpy: if True, return a numpy array instead of a list of array('d') rows
+        :return: a len(sources) x V distance table
+
+    :func iter_distance_rows(self, sources, workers=None, chunk_size=64):
+        Same as distance_matrix, but yields (chunk_sources, rows) tuples so the table never has to fit in memory.
+
+    :func shortest_path(self, src, dst, method='dijkstra', heuristic=None, stats=None):
+        Finds the shortest path between two vertices, stopping as soon as the target is settled.
+
+        :param src: an integer representing the source vertex
+        :param dst: an integer representing the target vertex
+        :param method: 'dijkstra', 'bidirectional' or 'astar'
+        :param heuristic: for 'astar', a function returning a lower bound of the distance from a vertex to dst
+        :param stats: an optional dictionary that receives the number of settled vertices under the 'settled' key
+        :return: a tuple of the distance and the list of vertices on the path (float('inf') and [] if dst is unreachable)
 
     """
     def __init__(self, vertices):
         self.V = vertices
         self.graph = {i: [] for i in range(vertices)}
+        self._csr = None
+        self._cache = None
+        # Кількість ребер кожної ваги, щоб тип і найбільша вага лишалися точними й після видалень
+        self._weight_counts = Counter()
+        self._fractional_weights = 0
+        self._max_weight = 0
 
     def add_edge(self, u, v, w):
         self.graph[u].append((v, w))
         self.graph[v].append((u, w))
+        self._note_weight(w)
+        self._edge_changed(u, v, math.inf, w)
+
+    def remove_edge(self, u, v):
+        old_weight = self._detach(u, v)
+        self._edge_changed(u, v, old_weight, math.inf)
+
+    def update_edge(self, u, v, w):
+        old_weight = self._detach(u, v)
+        self.graph[u].append((v, w))
+        self.graph[v].append((u, w))
+        self._note_weight(w)
+        self._edge_changed(u, v, old_weight, w)
+
+    def _note_weight(self, w):
+        self._weight_counts[w] += 1
+        self._fractional_weights += not is_integer_weight(w)
+        self._max_weight = max(self._max_weight, w)
+
+    def _forget_weight(self, w):
+        self._weight_counts[w] -= 1
+        self._fractional_weights -= not is_integer_weight(w)
+        if not self._weight_counts[w]:
+            del self._weight_counts[w]
+            if w == self._max_weight:
+                self._max_weight = max(self._weight_counts, default=0)
+
+    def _detach(self, u, v):
+        old_weight = edge_weight(self.graph, u, v)
+        if old_weight == math.inf:
+            raise ValueError(f"No edge between {u} and {v}")
+        removed = [w for x, w in self.graph[u] if x == v]
+        # Петля записана у списку суміжності двічі
+        for w in removed[::2] if u == v else removed:
+            self._forget_weight(w)
+        self.graph[u] = [(x, w) for x, w in self.graph[u] if x != v]
+        self.graph[v] = [(x, w) for x, w in self.graph[v] if x != u]
+        return old_weight
+
+    def _edge_changed(self, u, v, old_weight, new_weight):
+        self._csr = None
+        if self._cache is not None:
+            self._cache.edge_changed(self.graph, u, v, old_weight, new_weight)
+
+    def enable_cache(self, maxsize=128, repair=True):
+        self._cache = ShortestPathCache(maxsize, repair)
+
+    def disable_cache(self):
+        self._cache = None
+
+    def cache_info(self):
+        return self._cache.info() if self._cache is not None else None
+
+    def to_csr(self):
+        return graph_to_csr(self.graph, self.V)
+
+    def freeze(self):
+        if self._csr is None:
+            self._csr = self.to_csr()
+        return self._csr
+
+    def dijkstra(self, src, queue='heapq', stats=None):
+        if self._cache is not None:
+            if queue != 'heapq' or stats is not None:
+                raise ValueError("queue and stats are not supported while the cache is on")
+            return self.shortest_path_tree(src)[0]
+        if queue == 'auto':
+            queue = select_queue(*self.weight_profile(), self.V)
+        if queue != 'heapq':
+            return self._dijkstra_queue(src, queue, stats)
 
-    def dijkstra(self, src):
         min_heap = [(0, src)]
         distances = {i: float('inf') for i in range(self.V)}
         distances[src] = 0
+        stale = 0
 
         while min_heap:
             dist, current_vertex = heapq.heappop(min_heap)
 
             # Якщо дистанція в купі більше, ніж поточна дистанція, пропускаємо
             if dist > distances[current_vertex]:
+                stale += 1
                 continue
 
             for neighbor, weight in self.graph[current_vertex]:
@@ -57,8 +218,190 @@ class Graph:
                     distances[neighbor] = distance
                     heapq.heappush(min_heap, (distance, neighbor))
 
+        if stats is not None:
+            # Кожна досяжна вершина знімається з купи рівно один раз, решта записів застарілі
+            pops = sum(distance < math.inf for distance in distances.values())
+            stats.update(queue='heapq', pushes=pops + stale, pops=pops, stale=stale)
+        return distances
+
+    def weight_profile(self):
+        return self._fractional_weights == 0, self._max_weight
+
+    def _dijkstra_queue(self, src, kind, stats):
+        """
+        Runs Dijkstra's algorithm over a queue from task_3.queues, which settles every vertex once.
+
+        :return: the distances dictionary
+        """
+        if kind in ('dial', 'radix') and self._fractional_weights:
+            raise ValueError(f"The {kind!r} queue needs non-negative integer weights")
+        queue = make_queue(kind, self.V, self._max_weight)
+        distances = {i: float('inf') for i in range(self.V)}
+        distances[src] = 0
+        queue.push(src, 0)
+
+        while queue:
+            dist, current_vertex = queue.pop()
+            for neighbor, weight in self.graph[current_vertex]:
+                distance = dist + weight
+                if distance < distances[neighbor]:
+                    distances[neighbor] = distance
+                    queue.push(neighbor, distance)
+
+        if stats is not None:
+            stats.update(queue=kind, pushes=queue.pushes, pops=queue.pops, stale=queue.stale)
         return distances
 
+    def shortest_path_tree(self, src):
+        if self._cache is not None:
+            entry = self._cache.get(src)
+            if entry is None:
+                entry = self._dijkstra_tree(src)
+                self._cache.put(src, *entry)
+            # Повертаємо копії, щоб зміни викликача не зіпсували кеш
+            return dict(entry[0]), dict(entry[1])
+        return self._dijkstra_tree(src)
+
+    def _dijkstra_tree(self, src):
+        min_heap = [(0, src)]
+        distances = {i: float('inf') for i in range(self.V)}
+        predecessors = {i: None for i in range(self.V)}
+        distances[src] = 0
+
+        while min_heap:
+            dist, current_vertex = heapq.heappop(min_heap)
+            if dist > distances[current_vertex]:
+                continue
+
+            for neighbor, weight in self.graph[current_vertex]:
+                distance = dist + weight
+                if distance < distances[neighbor]:
+                    distances[neighbor] = distance
+                    predecessors[neighbor] = current_vertex
+                    heapq.heappush(min_heap, (distance, neighbor))
+
+        return distances, predecessors
+
+    def distance_matrix(self, sources, workers=None, chunk_size=64, as_numpy=False):
+        return batch.distance_matrix(self.freeze(), sources, workers, chunk_size, as_numpy)
+
+    def iter_distance_rows(self, sources, workers=None, chunk_size=64):
+        return batch.iter_distance_rows(self.freeze(), sources, workers, chunk_size)
+
+    def shortest_path(self, src, dst, method='dijkstra', heuristic=None, stats=None):
+        if method == 'dijkstra':
+            distance, meet, forward, backward, settled = self._search_to(src, dst, None)
+        elif method == 'astar':
+            if heuristic is None:
+                raise ValueError("A* search requires a heuristic")
+            distance, meet, forward, backward, settled = self._search_to(src, dst, heuristic)
+        elif method == 'bidirectional':
+            distance, meet, forward, backward, settled = self._bidirectional(src, dst)
+        else:
+            raise ValueError(f"Unknown shortest path method: {method}")
+
+        if stats is not None:
+            stats['settled'] = settled
+        if meet is None:
+            return float('inf'), []
+
+        path = []
+        vertex = meet
+        while vertex is not None:
+            path.append(vertex)
+            vertex = forward[vertex]
+        path.reverse()
+        vertex = backward.get(meet)
+        while vertex is not None:
+            path.append(vertex)
+            vertex = backward[vertex]
+        return distance, path
+
+    def _search_to(self, src, dst, heuristic):
+        """
+        Runs Dijkstra (or A* when a heuristic is given) from src and stops once dst is settled.
+
+        :return: a tuple of (distance, meeting vertex, forward predecessors, backward predecessors, settled count)
+        """
+        distances = {src: 0}
+        predecessors = {src: None}
+        min_heap = [(heuristic(src) if heuristic else 0, 0, src)]
+        settled = 0
+
+        while min_heap:
+            _, dist, current_vertex = heapq.heappop(min_heap)
+            if dist > distances[current_vertex]:
+                continue
+            settled += 1
+            if current_vertex == dst:
+                return dist, dst, predecessors, {}, settled
+
+            for neighbor, weight in self.graph[current_vertex]:
+                distance = dist + weight
+                if distance < distances.get(neighbor, math.inf):
+                    distances[neighbor] = distance
+                    predecessors[neighbor] = current_vertex
+                    priority = distance + heuristic(neighbor) if heuristic else distance
+                    heapq.heappush(min_heap, (priority, distance, neighbor))
+
+        return math.inf, None, predecessors, {}, settled
+
+    def _bidirectional(self, src, dst):
+        """
+        Runs Dijkstra from both ends at once and stops when the two frontiers can no longer improve the best meeting.
+
+        :return: a tuple of (distance, meeting vertex, forward predecessors, backward predecessors, settled count)
+        """
+        if src == dst:
+            return 0, src, {src: None}, {}, 1
+
+        distances = ({src: 0}, {dst: 0})
+        predecessors = ({src: None}, {dst: None})
+        heaps = ([(0, src)], [(0, dst)])
+        best, meet = math.inf, None
+        settled = 0
+
+        while heaps[0] and heaps[1]:
+            # Зупинка: жоден шлях через ще не оброблені вершини не буде коротшим за best
+            if heaps[0][0][0] + heaps[1][0][0] >= best:
+                break
+            side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+            dist, current_vertex = heapq.heappop(heaps[side])
+            own, other = distances[side], distances[1 - side]
+            if dist > own[current_vertex]:
+                continue
+            settled += 1
+
+            for neighbor, weight in self.graph[current_vertex]:
+                distance = dist + weight
+                if distance < own.get(neighbor, math.inf):
+                    own[neighbor] = distance
+                    predecessors[side][neighbor] = current_vertex
+                    heapq.heappush(heaps[side], (distance, neighbor))
+                if neighbor in other and own[neighbor] + other[neighbor] < best:
+                    best = own[neighbor] + other[neighbor]
+                    meet = neighbor
+
+        return best, meet, predecessors[0], predecessors[1], settled
+
+
+def euclidean_heuristic(coords, dst, scale=1):
+    """
+    Builds an A* heuristic from vertex coordinates.
+
+    :param coords: a mapping from vertex to its (x, y) coordinates
+    :param dst: the target vertex
+    :param scale: the minimal weight per unit of distance, which keeps the heuristic admissible
+    :return: a function returning the straight-line lower bound from a vertex to dst
+    """
+    tx, ty = coords[dst]
+
+    def heuristic(vertex):
+        x, y = coords[vertex]
+        return math.hypot(x - tx, y - ty) * scale
+
+    return heuristic
+
 
 if __name__ == "__main__":
     graph = Graph(9)
@@ -81,3 +424,6 @@ if __name__ == "__main__":
     print("Відстані від початкової вершини до всіх інших:")
     for vertex in range(graph.V):
         print(f"0 -> {vertex}: {distances[vertex]}")
+
+    distance, path = graph.shortest_path(0, 4, method='bidirectional')
+    print(f"Найкоротший шлях 0 -> 4: {path}, довжина {distance}")
@@ -0,0 +1,101 @@
+import heapq
+import math
+
+
+def edge_weight(adjacency, u, v):
+    """
+    Returns the effective weight of the undirected edge (u, v), i.e. the smallest of its parallel edges.
+
+    :param adjacency: the graph adjacency dictionary
+    :return: the weight, or float('inf') if u and v are not adjacent
+    """
+    return min((w for neighbor, w in adjacency[u] if neighbor == v), default=math.inf)
+
+
+def repair_decrease(adjacency, distances, predecessors, u, v, w):
+    """
+    Repairs a shortest-path tree after the undirected edge (u, v) got the weight w, where w is not
+    larger than before (a new edge or a weight decrease). Distances can only go down, so a Dijkstra
+    search is started from the improved endpoint and only relaxes vertices that actually improve.
+
+    :param adjacency: the graph adjacency dictionary, already updated
+    :param distances: the distances dictionary to repair in place
+    :param predecessors: the predecessors dictionary to repair in place
+    :return: the number of vertices whose distance changed
+    """
+    min_heap = []
+    for a, b in ((u, v), (v, u)):
+        if distances[a] + w < distances[b]:
+            distances[b] = distances[a] + w
+            predecessors[b] = a
+            heapq.heappush(min_heap, (distances[b], b))
+
+    changed = 0
+    while min_heap:
+        dist, current_vertex = heapq.heappop(min_heap)
+        if dist > distances[current_vertex]:
+            continue
+        changed += 1
+        for neighbor, weight in adjacency[current_vertex]:
+            distance = dist + weight
+            if distance < distances.get(neighbor, math.inf):
+                distances[neighbor] = distance
+                predecessors[neighbor] = current_vertex
+                heapq.heappush(min_heap, (distance, neighbor))
+    return changed
+
+
+def repair_increase(adjacency, distances, predecessors, u, v):
+    """
+    Repairs a shortest-path tree after the undirected edge (u, v) got heavier or was removed.
+
+    If the edge is not a tree edge, no distance can change. Otherwise only the subtree hanging
+    below it is affected: its vertices are reset, seeded with the best distance offered by their
+    unaffected neighbours and settled again with a Dijkstra search limited to that subtree.
+
+    :param adjacency: the graph adjacency dictionary, already updated
+    :param distances: the distances dictionary to repair in place
+    :param predecessors: the predecessors dictionary to repair in place
+    :return: the number of vertices in the affected subtree
+    """
+    if predecessors[v] == u:
+        root = v
+    elif predecessors[u] == v:
+        root = u
+    else:
+        return 0
+
+    affected = {root}
+    stack = [root]
+    while stack:
+        current_vertex = stack.pop()
+        for neighbor, _ in adjacency[current_vertex]:
+            if neighbor not in affected and predecessors[neighbor] == current_vertex:
+                affected.add(neighbor)
+                stack.append(neighbor)
+
+    # Скидаємо все піддерево і пробуємо під'єднати кожну вершину до незачеплених сусідів
+    for vertex in affected:
+        distances[vertex] = math.inf
+        predecessors[vertex] = None
+
+    min_heap = []
+    for vertex in affected:
+        for neighbor, weight in adjacency[vertex]:
+            if neighbor not in affected and distances[neighbor] + weight < distances[vertex]:
+                distances[vertex] = distances[neighbor] + weight
+                predecessors[vertex] = neighbor
+        if distances[vertex] < math.inf:
+            heapq.heappush(min_heap, (distances[vertex], vertex))
+
+    while min_heap:
+        dist, current_vertex = heapq.heappop(min_heap)
+        if dist > distances[current_vertex]:
+            continue
+        for neighbor, weight in adjacency[current_vertex]:
+            distance = dist + weight
+            if neighbor in affected and distance < distances[neighbor]:
+                distances[neighbor] = distance
+                predecessors[neighbor] = current_vertex
+                heapq.heappush(min_heap, (distance, neighbor))
+    return len(affected)
@@ -0,0 +1,94 @@
+from array import array
+
+
+class IndexedHeap:
+    """
+    :class: IndexedHeap
+
+    A binary min-heap over the integer items 0..capacity-1 that supports a true decrease-key.
+    The position of every item inside the heap is kept in a typed array, so each item appears in
+    the heap at most once and the heap never grows beyond the number of items.
+
+    :ivar pushes: the number of inserted items
+    :ivar decreases: the number of decrease-key operations
+    :ivar pops: the number of removed items
+    :ivar stale: always 0, since there are no outdated entries to skip (kept for parity with task_3.queues)
+
+    :func push(self, item, key):
+        Inserts the item, or lowers its key if it is already in the heap and the new key is smaller.
+
+    :func pop(self):
+        Removes the item with the smallest key and returns a (key, item) tuple.
+
+    """
+    def __init__(self, capacity):
+        self._keys = []
+        self._items = []
+        self._position = array('q', [-1]) * capacity
+        self.pushes = 0
+        self.decreases = 0
+        self.pops = 0
+        self.stale = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, item):
+        return self._position[item] >= 0
+
+    def push(self, item, key):
+        index = self._position[item]
+        if index < 0:
+            index = len(self._items)
+            self._keys.append(key)
+            self._items.append(item)
+            self.pushes += 1
+        elif key < self._keys[index]:
+            self._keys[index] = key
+            self.decreases += 1
+        else:
+            return
+        self._sift_up(index, key, item)
+
+    def pop(self):
+        keys, items, position = self._keys, self._items, self._position
+        key, item = keys[0], items[0]
+        position[item] = -1
+        last_key, last_item = keys.pop(), items.pop()
+        if items:
+            self._sift_down(0, last_key, last_item)
+        self.pops += 1
+        return key, item
+
+    def _sift_up(self, index, key, item):
+        keys, items, position = self._keys, self._items, self._position
+        while index > 0:
+            parent = (index - 1) >> 1
+            if keys[parent] <= key:
+                break
+            keys[index] = keys[parent]
+            items[index] = items[parent]
+            position[items[index]] = index
+            index = parent
+        keys[index] = key
+        items[index] = item
+        position[item] = index
+
+    def _sift_down(self, index, key, item):
+        keys, items, position = self._keys, self._items, self._position
+        size = len(items)
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            if child + 1 < size and keys[child + 1] < keys[child]:
+                child += 1
+            if keys[child] >= key:
+                break
+            keys[index] = keys[child]
+            items[index] = items[child]
+            position[items[index]] = index
+            index = child
+        keys[index] = key
+        items[index] = item
+        position[item] = index
@@ -0,0 +1,79 @@
+import asyncio
+import random
+import statistics
+import sys
+import time
+
+from task_3.benchmark import random_graph
+from task_3.service import ShortestPathService
+
+
+def pick_sources(vertices, count, hot=64, hot_share=0.8, seed=0):
+    """
+    Draws query sources the way real traffic looks: most requests go to a small set of popular vertices.
+
+    :param vertices: The number of vertices.
+    :param count: The number of sources.
+    :param hot: The number of popular vertices.
+    :param hot_share: The share of requests that go to the popular vertices.
+    :param seed: The random seed.
+    :return: A list of source vertices.
+    """
+    rnd = random.Random(seed)
+    popular = rnd.sample(range(vertices), min(hot, vertices))
+    return [rnd.choice(popular) if rnd.random() < hot_share else rnd.randrange(vertices) for _ in range(count)]
+
+
+async def run_clients(service, sources, clients):
+    """
+    Sends the requests from concurrent clients, each waiting for its answer before the next request.
+
+    :param service: A running ShortestPathService.
+    :param sources: The sources to query, split between the clients.
+    :param clients: The number of concurrent clients.
+    :return: A list of request latencies in seconds.
+    """
+    latencies = []
+
+    async def client(own_sources):
+        for src in own_sources:
+            start = time.perf_counter()
+            await service.distances(src)
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(client(sources[i::clients]) for i in range(clients)))
+    return latencies
+
+
+async def load_test(graph, sources, clients, coalesce, workers=None):
+    async with ShortestPathService(graph, coalesce=coalesce, workers=workers) as service:
+        start = time.perf_counter()
+        latencies = await run_clients(service, sources, clients)
+        elapsed = time.perf_counter() - start
+    return elapsed, latencies, service.info()
+
+
+def report(vertices, clients, requests, workers=None):
+    """
+    Runs the same load with and without coalescing and prints throughput and latency percentiles.
+
+    :param vertices: The number of vertices of the random graph.
+    :param clients: The number of concurrent clients.
+    :param requests: The total number of requests.
+    :param workers: The number of worker processes of the service (default: the number of CPUs).
+    """
+    graph = random_graph(vertices)
+    sources = pick_sources(vertices, requests)
+    print(f"V={vertices}, клієнтів: {clients}, запитів: {requests}")
+    print(f"{'mode':<14} {'req/s':>8} {'p50, ms':>9} {'p99, ms':>9} {'computed':>9} {'batches':>8}")
+    for name, coalesce in (("coalescing", True), ("no coalescing", False)):
+        elapsed, latencies, info = asyncio.run(load_test(graph, sources, clients, coalesce, workers))
+        percentiles = statistics.quantiles(latencies, n=100)
+        print(f"{name:<14} {requests / elapsed:>8.1f} {percentiles[49] * 1000:>9.1f} {percentiles[98] * 1000:>9.1f} "
+              f"{info.computed:>9} {info.batches:>8}")
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:]]
+    vertices, clients, requests = args + [5000, 64, 1000][len(args):]
+    report(vertices, clients, requests)
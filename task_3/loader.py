@@ -0,0 +1,168 @@
+import mmap
+import struct
+import sys
+import warnings
+from array import array
+
+import numpy as np
+
+from task_3.csr import CSRGraph
+
+SNAPSHOT_MAGIC = b'CSRLE001' if sys.byteorder == 'little' else b'CSRBE001'
+# Заголовок: magic, кількість вершин, кількість орієнтованих ребер (кратний 8 байтам)
+SNAPSHOT_HEADER = struct.Struct('=8sqq')
+
+
+def read_edge_chunks(path, delimiter=None, skip_header=False, comment='#', chunk_size=1 << 22):
+    """
+    Streams an edge list file as NumPy column arrays, one chunk at a time.
+
+    Every chunk of lines is parsed by np.loadtxt's C reader, so no Python object is created per token.
+
+    :param path: the path to a text file with "u v w" lines
+    :param delimiter: the column delimiter, e.g. ',' for CSV or '\t' for TSV (None splits on any whitespace)
+    :param skip_header: whether the first line is a header
+    :param comment: text after this prefix is ignored, so comment lines are skipped
+    :param chunk_size: the approximate number of bytes read per chunk
+    :return: a generator of (sources, targets, weights) arrays of int64, int64 and float64
+    """
+    with open(path, 'r') as f:
+        if skip_header:
+            f.readline()
+        while True:
+            lines = f.readlines(chunk_size)
+            if not lines:
+                return
+            yield _parse_edges(lines, path, delimiter, 0, comment)
+
+
+def load_edge_list(path, vertices=None, delimiter=None, skip_header=False, comment='#'):
+    """
+    Loads an undirected weighted edge list file straight into a CSRGraph.
+
+    The whole file is parsed in one pass of np.loadtxt's C reader and then laid out by edges_to_csr,
+    so no per-edge Python objects are created. The neighbour order of every vertex is the same as if
+    the edges were added one by one with Graph.add_edge.
+
+    :param path: the path to a text file with "u v w" lines
+    :param vertices: the number of vertices (default: the largest vertex id + 1)
+    :param delimiter: the column delimiter, e.g. ',' for CSV or '\t' for TSV (None splits on any whitespace)
+    :param skip_header: whether the first line is a header
+    :param comment: text after this prefix is ignored, so comment lines are skipped
+    :return: the CSRGraph instance
+    """
+    sources, targets, weights = _parse_edges(path, path, delimiter, int(skip_header), comment)
+    if vertices is None:
+        vertices = int(max(sources.max(initial=-1), targets.max(initial=-1))) + 1
+    return edges_to_csr(sources, targets, weights, vertices)
+
+
+def _parse_edges(source, path, delimiter, skip_rows, comment):
+    """
+    Parses "u v w" lines from a file path or a list of lines with np.loadtxt.
+
+    :return: a tuple of (sources, targets, weights) arrays of int64, int64 and float64
+    """
+    with warnings.catch_warnings():
+        # Порожній файл або лише коментарі — це граф без ребер, а не помилка
+        warnings.filterwarnings('ignore', message='loadtxt: input contained no data')
+        try:
+            values = np.loadtxt(source, dtype=np.float64, comments=comment, delimiter=delimiter,
+                                skiprows=skip_rows, ndmin=2)
+        except ValueError as error:
+            raise ValueError(f"{path}: {error}") from None
+    if values.size == 0:
+        values = values.reshape(0, 3)
+    if values.shape[1] != 3:
+        raise ValueError(f"{path}: every edge line must have exactly three columns")
+    sources, targets = values[:, 0], values[:, 1]
+    if not (np.array_equal(sources, np.floor(sources)) and np.array_equal(targets, np.floor(targets))):
+        raise ValueError(f"{path}: vertex ids must be integers")
+    return sources.astype(np.int64), targets.astype(np.int64), values[:, 2].copy()
+
+
+def edges_to_csr(sources, targets, weights, vertices):
+    """
+    Builds a CSRGraph of an undirected graph from parallel edge arrays.
+
+    Every edge u-v is turned into the directed entries u->v and v->u, interleaved in edge order, and
+    the entries are grouped by their tail vertex keeping that order. Sorting the unique keys
+    tail * n + position with np.sort gives the same order as a stable argsort by tail, but several
+    times faster. The offsets are the cumulative degree counts from np.bincount.
+
+    :param sources: the first endpoints of the edges
+    :param targets: the second endpoints of the edges
+    :param weights: the edge weights
+    :param vertices: the number of vertices
+    :return: the CSRGraph instance with array('q') offsets and targets and array('d') weights
+    """
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    weights = np.asarray(weights, dtype=np.float64)
+    tails = np.stack((sources, targets), axis=1).ravel()
+    heads = np.stack((targets, sources), axis=1).ravel()
+    if len(tails) and (tails.min() < 0 or tails.max() >= vertices):
+        raise ValueError(f"Vertex ids must be between 0 and {vertices - 1}")
+
+    entries = len(tails)
+    order = np.sort(tails * entries + np.arange(entries)) % max(entries, 1)
+    offsets = np.zeros(vertices + 1, dtype=np.int64)
+    np.cumsum(np.bincount(tails, minlength=vertices), out=offsets[1:])
+    return CSRGraph(_typed(offsets, 'q'), _typed(heads[order], 'q'), _typed(np.repeat(weights, 2)[order], 'd'))
+
+
+def _typed(values, typecode):
+    """
+    Copies a NumPy array into an array.array, which CSRGraph.dijkstra indexes much faster.
+    """
+    result = array(typecode)
+    result.frombytes(values.tobytes())
+    return result
+
+
+def save_snapshot(csr, path):
+    """
+    Writes a CSRGraph into a binary snapshot: a fixed header followed by the raw offsets, targets and weights.
+
+    :param csr: the CSRGraph to save
+    :param path: the target file path
+    """
+    with open(path, 'wb') as f:
+        f.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, csr.V, csr.E))
+        for buffer in (csr.offsets, csr.targets, csr.weights):
+            f.write(buffer)
+
+
+def load_snapshot(path):
+    """
+    Memory-maps a binary snapshot written by save_snapshot.
+
+    Nothing is parsed or copied: the returned CSRGraph reads its arrays straight from the mapped
+    file, and pages are loaded lazily by the operating system. The mapping stays open for as long
+    as the graph is alive.
+
+    :param path: the snapshot file path
+    :return: the CSRGraph instance
+    """
+    with open(path, 'rb') as f:
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        if len(mapping) < SNAPSHOT_HEADER.size:
+            raise ValueError(f"{path}: truncated graph snapshot")
+        magic, vertices, edges = SNAPSHOT_HEADER.unpack_from(mapping)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError(f"{path}: not a graph snapshot for this platform")
+        if vertices < 0 or edges < 0 or len(mapping) != SNAPSHOT_HEADER.size + (vertices + 1 + 2 * edges) * 8:
+            raise ValueError(f"{path}: truncated graph snapshot")
+    except BaseException:
+        mapping.close()
+        raise
+
+    view = memoryview(mapping)
+    start = SNAPSHOT_HEADER.size
+    buffers = []
+    for typecode, length in (('q', vertices + 1), ('q', edges), ('d', edges)):
+        end = start + length * 8
+        buffers.append(view[start:end].cast(typecode))
+        start = end
+    return CSRGraph(*buffers, mapping=mapping)
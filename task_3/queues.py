@@ -0,0 +1,210 @@
+import heapq
+import math
+import numbers
+
+from task_3.indexed_heap import IndexedHeap
+
+# Межі, за яких queue="auto" обирає відра Діала замість heapq: малі цілі ваги й великий граф
+DIAL_MAX_WEIGHT = 16
+DIAL_MIN_VERTICES = 50000
+
+
+class _LazyQueue:
+    """
+    The shared bookkeeping of the queues with lazy deletion: a decrease-key inserts a new entry, and
+    outdated entries are skipped (and counted as stale) when they reach the front.
+
+    :ivar pushes: the number of inserted entries
+    :ivar pops: the number of returned items
+    :ivar stale: the number of outdated entries skipped while popping
+    """
+    def __init__(self, capacity):
+        self._key = [math.inf] * capacity
+        self._done = bytearray(capacity)
+        self._size = 0
+        self.pushes = 0
+        self.pops = 0
+        self.stale = 0
+
+    def __len__(self):
+        return self._size
+
+    def _accept(self, item, key):
+        """
+        Records the new key of an item, returning False if it does not improve the current one.
+        """
+        if self._done[item] or key >= self._key[item]:
+            return False
+        if self._key[item] == math.inf:
+            self._size += 1
+        self._key[item] = key
+        self.pushes += 1
+        return True
+
+    def _settle(self, key, item):
+        self._done[item] = 1
+        self._size -= 1
+        self.pops += 1
+        return key, item
+
+
+class LazyHeap(_LazyQueue):
+    """
+    :class: LazyHeap
+
+    The binary heap from heapq with lazy deletion, as in Graph.dijkstra: every decrease-key adds an
+    entry, so the heap can grow to O(E) entries.
+
+    :func push(self, item, key):
+        Inserts the item, or lowers its key if the new key is smaller.
+
+    :func pop(self):
+        Removes the item with the smallest key and returns a (key, item) tuple.
+
+    """
+    def __init__(self, capacity):
+        super().__init__(capacity)
+        self._heap = []
+
+    def push(self, item, key):
+        if self._accept(item, key):
+            heapq.heappush(self._heap, (key, item))
+
+    def pop(self):
+        heap, current = self._heap, self._key
+        key, item = heapq.heappop(heap)
+        while key != current[item] or self._done[item]:
+            self.stale += 1
+            key, item = heapq.heappop(heap)
+        return self._settle(key, item)
+
+
+class DialQueue(_LazyQueue):
+    """
+    :class: DialQueue
+
+    Dial's bucket queue for non-negative integer keys that grow monotonically, as in Dijkstra with
+    integer edge weights. There is one bucket per key modulo max_weight + 1: all keys in the queue
+    lie within max_weight of the last popped key, so the buckets never mix keys. Push is O(1), and
+    pop scans at most max_weight + 1 buckets.
+
+    :func push(self, item, key):
+        Inserts the item, or lowers its key if the new key is smaller.
+
+    :func pop(self):
+        Removes the item with the smallest key and returns a (key, item) tuple.
+
+    """
+    def __init__(self, capacity, max_weight):
+        super().__init__(capacity)
+        self._buckets = [[] for _ in range(max_weight + 1)]
+        self._cursor = 0
+
+    def push(self, item, key):
+        if self._accept(item, key):
+            self._buckets[key % len(self._buckets)].append(item)
+
+    def pop(self):
+        buckets, current, done = self._buckets, self._key, self._done
+        cursor = self._cursor
+        while True:
+            bucket = buckets[cursor % len(buckets)]
+            while bucket:
+                item = bucket.pop()
+                if current[item] == cursor and not done[item]:
+                    self._cursor = cursor
+                    return self._settle(cursor, item)
+                self.stale += 1
+            cursor += 1
+
+
+class RadixHeap(_LazyQueue):
+    """
+    :class: RadixHeap
+
+    A radix heap for non-negative integer keys that grow monotonically. An entry lives in the bucket
+    given by the highest bit in which its key differs from the last popped key, so there are only
+    about log2(max key) buckets. When bucket 0 runs empty, the first non-empty bucket is emptied: its
+    smallest key becomes the new last key and its entries move to lower buckets. Every entry moves
+    down at most once per bucket, which makes pop amortized O(log C) for weights up to C.
+
+    :func push(self, item, key):
+        Inserts the item, or lowers its key if the new key is smaller.
+
+    :func pop(self):
+        Removes the item with the smallest key and returns a (key, item) tuple.
+
+    """
+    def __init__(self, capacity):
+        super().__init__(capacity)
+        self._buckets = [[] for _ in range(65)]
+        self._last = 0
+
+    def push(self, item, key):
+        if self._accept(item, key):
+            self._buckets[(key ^ self._last).bit_length()].append((key, item))
+
+    def pop(self):
+        buckets, current, done = self._buckets, self._key, self._done
+        while True:
+            if not buckets[0]:
+                index = 1
+                while not buckets[index]:
+                    index += 1
+                entries = buckets[index]
+                buckets[index] = []
+                last = self._last = min(key for key, _ in entries)
+                for key, item in entries:
+                    buckets[(key ^ last).bit_length()].append((key, item))
+            key, item = buckets[0].pop()
+            if key == current[item] and not done[item]:
+                return self._settle(key, item)
+            self.stale += 1
+
+
+QUEUES = ('heapq', 'indexed', 'dial', 'radix')
+
+
+def make_queue(kind, capacity, max_weight=None):
+    """
+    Creates a priority queue for Dijkstra's algorithm over the items 0..capacity-1.
+
+    :param kind: 'heapq', 'indexed', 'dial' or 'radix'
+    :param capacity: the number of items
+    :param max_weight: the largest edge weight, required by 'dial'
+    :return: a queue with push(item, key), pop() -> (key, item), len() and pushes / pops counters
+    """
+    if kind == 'heapq':
+        return LazyHeap(capacity)
+    if kind == 'indexed':
+        return IndexedHeap(capacity)
+    if kind == 'dial':
+        return DialQueue(capacity, max_weight)
+    if kind == 'radix':
+        return RadixHeap(capacity)
+    raise ValueError(f"Unknown priority queue: {kind}")
+
+
+def select_queue(integer_weights, max_weight, vertices):
+    """
+    Picks the queue for a graph from the type and the range of its edge weights and its size.
+
+    The queues here are written in Python, so they only beat the C-implemented heapq where heapq's
+    log factor outweighs the interpreter overhead: Dial's buckets with integer weights up to
+    DIAL_MAX_WEIGHT, where a pop scans at most that many empty buckets, on graphs of at least
+    DIAL_MIN_VERTICES vertices. Even there Dial only wins when the frontier is large, as in random
+    graphs (about 30% faster); on grid-like graphs it is up to 10% slower. That is why
+    Graph.dijkstra uses heapq unless queue='auto' is asked for. The radix heap is never picked.
+
+    :param integer_weights: whether all edge weights are non-negative integers
+    :param max_weight: the largest edge weight
+    :param vertices: the number of vertices
+    :return: 'dial' for small integer weights on large graphs and 'heapq' otherwise
+    """
+    if integer_weights and max_weight <= DIAL_MAX_WEIGHT and vertices >= DIAL_MIN_VERTICES:
+        return 'dial'
+    return 'heapq'
+
+
+def is_integer_weight(weight):
+    return isinstance(weight, numbers.Integral) and weight >= 0
@@ -0,0 +1,167 @@
+import asyncio
+import os
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+
+from task_3 import batch
+
+ServiceInfo = namedtuple('ServiceInfo', ['requests', 'coalesced', 'batches', 'computed'])
+
+
+class ShortestPathService:
+    """
+
+    :class: ShortestPathService
+
+    An asyncio front end that answers single-source distance queries for a Graph without blocking
+    the event loop.
+
+    Concurrent requests for a source that is already being computed wait for that computation
+    instead of starting another one. Distinct sources that arrive within a short window are
+    collected into one batch and solved together by a worker pool that shares the frozen CSR graph
+    (see task_3.batch). Requests wait in a bounded queue, so callers are slowed down rather than
+    piling up work when the pool falls behind.
+
+    The graph is frozen when the service starts; later changes to the Graph are not seen until the
+    service is restarted.
+
+    Usage::
+
+        async with ShortestPathService(graph) as service:
+            row = await service.distances(0)
+
+    :ivar window: how long, in seconds, a batch waits for more sources after its first one
+    :ivar max_batch: the largest number of sources per batch
+    :ivar coalesce: whether concurrent requests for the same source share one computation
+
+    :func distances(self, src):
+        Returns the distances from src to all vertices as an array('d') indexed by vertex. Coalesced
+        callers receive the same array, which must not be modified.
+
+    :func distance(self, src, dst):
+        Returns the distance from src to dst.
+
+    :func info(self):
+        :return: a ServiceInfo named tuple with the numbers of requests, coalesced requests, batches and computed sources
+
+    """
+    def __init__(self, graph, window=0.002, max_batch=32, max_pending=1024, workers=None, coalesce=True):
+        self.window = window
+        self.max_batch = max_batch
+        self.coalesce = coalesce
+        self._graph = graph
+        self._workers = workers or os.cpu_count() or 1
+        self._max_pending = max_pending
+        self._queue = None
+        self._inflight = {}
+        self._running = set()
+        self._slots = None
+        self._batcher = None
+        self._executor = None
+        self._resources = ExitStack()
+        self._csr = None
+        self.requests = 0
+        self.coalesced = 0
+        self.batches = 0
+        self.computed = 0
+
+    async def __aenter__(self):
+        self._csr = self._graph.freeze()
+        if self._workers == 1:
+            self._executor = self._resources.enter_context(ThreadPoolExecutor(max_workers=1))
+        else:
+            self._executor = self._resources.enter_context(batch.worker_pool(self._csr, self._workers))
+        self._queue = asyncio.Queue(maxsize=self._max_pending)
+        # Не більше двох пакетів на воркер одночасно, решта чекає в обмеженій черзі
+        self._slots = asyncio.Semaphore(2 * self._workers)
+        self._batcher = asyncio.create_task(self._collect())
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self._queue.join()
+        if self._running:
+            await asyncio.gather(*self._running)
+        self._batcher.cancel()
+        try:
+            await self._batcher
+        except asyncio.CancelledError:
+            pass
+        self._resources.close()
+
+    async def distances(self, src):
+        if not 0 <= src < self._csr.V:
+            raise ValueError(f"No vertex {src}")
+        self.requests += 1
+        if self.coalesce and src in self._inflight:
+            self.coalesced += 1
+            return await asyncio.shield(self._inflight[src])
+
+        future = asyncio.get_running_loop().create_future()
+        if self.coalesce:
+            self._inflight[src] = future
+        try:
+            await self._queue.put((src, future))
+        except BaseException:
+            # Запит скасовано ще до черги: майбутні запити того ж джерела не мають чекати на нього
+            if self._inflight.get(src) is future:
+                del self._inflight[src]
+            future.cancel()
+            raise
+        return await asyncio.shield(future)
+
+    async def distance(self, src, dst):
+        return (await self.distances(src))[dst]
+
+    def info(self):
+        return ServiceInfo(self.requests, self.coalesced, self.batches, self.computed)
+
+    async def _collect(self):
+        while True:
+            requests = [await self._queue.get()]
+            if self.window > 0 and self._queue.qsize() < self.max_batch - 1:
+                await asyncio.sleep(self.window)
+            while len(requests) < self.max_batch and not self._queue.empty():
+                requests.append(self._queue.get_nowait())
+            await self._slots.acquire()
+            task = asyncio.create_task(self._solve(requests))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _solve(self, requests):
+        if self.coalesce:
+            futures = {}
+            for src, future in requests:
+                futures.setdefault(src, []).append(future)
+            sources = list(futures)
+            waiting = list(futures.values())
+        else:
+            sources = [src for src, _ in requests]
+            waiting = [[future] for _, future in requests]
+        try:
+            loop = asyncio.get_running_loop()
+            if self._workers == 1:
+                rows = await loop.run_in_executor(self._executor, self._solve_local, sources)
+            else:
+                rows = await loop.run_in_executor(self._executor, batch.solve_sources, sources)
+            self.batches += 1
+            self.computed += len(sources)
+            for row, src_futures in zip(rows, waiting):
+                for future in src_futures:
+                    if not future.done():
+                        future.set_result(row)
+        except Exception as error:
+            for src_futures in waiting:
+                for future in src_futures:
+                    if not future.done():
+                        future.set_exception(error)
+        finally:
+            for src, src_futures in zip(sources, waiting):
+                if self._inflight.get(src) is src_futures[0]:
+                    del self._inflight[src]
+            self._slots.release()
+            for _ in requests:
+                self._queue.task_done()
+
+    def _solve_local(self, sources):
+        return [self._csr.dijkstra(src) for src in sources]
@@ -0,0 +1,126 @@
+import math
+import random
+
+import pytest
+
+from task_3.dijkstra import Graph
+from task_3.dynamic import edge_weight
+
+
+def random_graph(vertices, edges, seed):
+    rnd = random.Random(seed)
+    graph = Graph(vertices)
+    for _ in range(edges):
+        graph.add_edge(rnd.randrange(vertices), rnd.randrange(vertices), rnd.randint(1, 20))
+    return graph
+
+
+def fresh_distances(graph, src):
+    # Копія графа без кешу, щоб порівнювати з повним запуском Дейкстри
+    uncached = Graph(graph.V)
+    uncached.graph = {v: list(edges) for v, edges in graph.graph.items()}
+    return uncached.dijkstra(src, queue='heapq')
+
+
+def check_tree(graph, src, distances, predecessors):
+    assert distances == fresh_distances(graph, src)
+    assert predecessors[src] is None
+    for v, parent in predecessors.items():
+        if v == src or distances[v] == math.inf:
+            assert parent is None
+        else:
+            weight = min(w for x, w in graph.graph[parent] if x == v)
+            assert distances[parent] + weight == distances[v]
+
+
+def test_hits_misses_and_lru_eviction():
+    graph = random_graph(40, 80, seed=0)
+    graph.enable_cache(maxsize=2)
+    for src in (0, 1, 0, 2, 1):
+        assert graph.dijkstra(src) == fresh_distances(graph, src)
+    info = graph.cache_info()
+    # 1 витіснено джерелом 2, тож останній запит до нього знову промах
+    assert (info.hits, info.misses, info.currsize) == (1, 4, 2)
+
+
+def test_returned_trees_are_copies():
+    graph = random_graph(40, 80, seed=1)
+    graph.enable_cache()
+    graph.dijkstra(0)[1] = -1
+    graph.shortest_path_tree(0)[1][1] = -1
+    check_tree(graph, 0, *graph.shortest_path_tree(0))
+
+
+def test_add_edge_repairs_or_evicts_affected_trees():
+    for repair in (True, False):
+        rnd = random.Random(2)
+        graph = random_graph(50, 70, seed=20)
+        graph.enable_cache(maxsize=None, repair=repair)
+        sources = range(0, 50, 5)
+        for _ in range(30):
+            for src in sources:
+                check_tree(graph, src, *graph.shortest_path_tree(src))
+            graph.add_edge(rnd.randrange(50), rnd.randrange(50), rnd.randint(1, 20))
+        info = graph.cache_info()
+        if repair:
+            assert info.repairs > 0 and info.invalidations == 0
+        else:
+            assert info.invalidations > 0 and info.repairs == 0
+
+
+def test_disable_cache():
+    graph = random_graph(20, 40, seed=3)
+    graph.enable_cache()
+    graph.dijkstra(0)
+    graph.disable_cache()
+    assert graph.cache_info() is None
+    assert graph.dijkstra(0) == fresh_distances(graph, 0)
+
+
+def test_update_and_remove_edge_repair_trees():
+    for repair in (True, False):
+        rnd = random.Random(4)
+        graph = random_graph(50, 90, seed=40)
+        graph.enable_cache(maxsize=None, repair=repair)
+        sources = range(0, 50, 5)
+        for step in range(60):
+            for src in sources:
+                check_tree(graph, src, *graph.shortest_path_tree(src))
+            u = rnd.randrange(50)
+            while not graph.graph[u]:
+                u = rnd.randrange(50)
+            v = rnd.choice(graph.graph[u])[0]
+            action = step % 3
+            if action == 0:
+                # Збільшення ваги ребра дерева — найскладніший випадок ремонту
+                graph.update_edge(u, v, edge_weight(graph.graph, u, v) + rnd.randint(1, 30))
+            elif action == 1:
+                graph.update_edge(u, v, rnd.randint(1, 20))
+            else:
+                graph.remove_edge(u, v)
+                graph.add_edge(rnd.randrange(50), rnd.randrange(50), rnd.randint(1, 20))
+        info = graph.cache_info()
+        assert (info.repairs > 0) == repair and (info.invalidations > 0) != repair
+
+
+def test_remove_edge_can_disconnect_vertices():
+    graph = Graph(4)
+    graph.add_edge(0, 1, 1)
+    graph.add_edge(1, 2, 1)
+    graph.add_edge(2, 3, 1)
+    graph.enable_cache()
+    graph.shortest_path_tree(0)
+    graph.remove_edge(1, 2)
+    distances, predecessors = graph.shortest_path_tree(0)
+    assert distances == {0: 0, 1: 1, 2: math.inf, 3: math.inf}
+    assert predecessors == {0: None, 1: 0, 2: None, 3: None}
+    assert graph.cache_info().repairs == 1
+
+
+def test_update_or_remove_missing_edge():
+    graph = random_graph(10, 0, seed=0)
+    graph.enable_cache()
+    with pytest.raises(ValueError):
+        graph.update_edge(0, 1, 5)
+    with pytest.raises(ValueError):
+        graph.remove_edge(0, 1)
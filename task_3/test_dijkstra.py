@@ -0,0 +1,68 @@
+import random
+
+import pytest
+
+from task_3.dijkstra import Graph
+from task_3.queues import QUEUES, select_queue
+
+
+def random_graph(vertices, seed=0):
+    # Кістяковий шлях робить граф зв'язним, тож кожна черга знімає всі вершини
+    rnd = random.Random(seed)
+    graph = Graph(vertices)
+    order = list(range(vertices))
+    rnd.shuffle(order)
+    for u, v in zip(order, order[1:]):
+        graph.add_edge(u, v, rnd.randint(1, 100))
+    for _ in range(vertices):
+        graph.add_edge(rnd.randrange(vertices), rnd.randrange(vertices), rnd.randint(1, 100))
+    return graph
+
+
+def test_every_queue_gives_the_same_distances_and_reports_stats():
+    graph = random_graph(500)
+    expected = graph.dijkstra(0, queue='heapq')
+    for queue in QUEUES:
+        stats = {}
+        assert graph.dijkstra(0, queue=queue, stats=stats) == expected
+        assert stats['queue'] == queue
+        assert stats['pops'] == graph.V
+        assert stats['pushes'] >= stats['pops'] + stats['stale']
+
+
+def test_weight_profile():
+    graph = random_graph(50)
+    assert graph.weight_profile() == (True, max(w for edges in graph.graph.values() for _, w in edges))
+    graph.add_edge(0, 1, 0.5)
+    assert graph.weight_profile()[0] is False
+    graph.remove_edge(0, 1)
+    graph.add_edge(2, 3, 10 ** 6)
+    graph.add_edge(2, 3, 10 ** 6)
+    graph.add_edge(4, 4, 10 ** 5)
+    assert graph.weight_profile() == (True, 10 ** 6)
+    graph.update_edge(2, 3, 7)
+    assert graph.weight_profile() == (True, 10 ** 5)
+    graph.remove_edge(4, 4)
+    assert graph.weight_profile()[1] < 10 ** 5
+
+
+def test_auto_picks_dial_only_for_small_weights_on_large_graphs():
+    assert select_queue(True, 10, 10 ** 5) == 'dial'
+    assert select_queue(True, 10, 1000) == 'heapq'
+    assert select_queue(True, 100, 10 ** 5) == 'heapq'
+    assert select_queue(False, 10, 10 ** 5) == 'heapq'
+    graph = Graph(3)
+    graph.add_edge(0, 1, 2)
+    stats = {}
+    graph.dijkstra(0, stats=stats)
+    assert stats['queue'] == 'heapq'
+
+
+def test_queue_and_stats_are_rejected_while_the_cache_is_on():
+    graph = random_graph(50)
+    graph.enable_cache()
+    assert graph.dijkstra(0) == graph.shortest_path_tree(0)[0]
+    with pytest.raises(ValueError):
+        graph.dijkstra(0, queue='dial')
+    with pytest.raises(ValueError):
+        graph.dijkstra(0, stats={})
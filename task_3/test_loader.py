@@ -0,0 +1,67 @@
+import random
+
+import pytest
+
+from task_3.dijkstra import Graph
+from task_3.loader import load_edge_list, load_snapshot, read_edge_chunks, save_snapshot
+
+
+def write_edges(path, edges, delimiter=' ', header=None):
+    with open(path, 'w') as f:
+        if header:
+            f.write(header + '\n')
+        f.write('# comment\n')
+        for edge in edges:
+            f.write(delimiter.join(map(str, edge)) + '\n')
+
+
+def random_edges(vertices, count, seed):
+    rnd = random.Random(seed)
+    return [(rnd.randrange(vertices), rnd.randrange(vertices), rnd.choice((rnd.randint(1, 9), rnd.random())))
+            for _ in range(count)]
+
+
+@pytest.mark.parametrize('delimiter', [' ', ',', '\t'])
+def test_load_edge_list_matches_add_edge(tmp_path, delimiter):
+    edges = random_edges(40, 300, seed=0) + [(5, 5, 2)]
+    path = tmp_path / 'edges.txt'
+    write_edges(path, edges, delimiter, header='u v w')
+    graph = Graph(45)
+    for u, v, w in edges:
+        graph.add_edge(u, v, w)
+    expected = graph.to_csr()
+    csr = load_edge_list(path, vertices=45, delimiter=None if delimiter == ' ' else delimiter, skip_header=True)
+    for name in ('offsets', 'targets', 'weights'):
+        assert list(getattr(csr, name)) == list(getattr(expected, name))
+    assert list(csr.dijkstra(0)) == list(expected.dijkstra(0))
+    chunks = read_edge_chunks(path, None if delimiter == ' ' else delimiter, skip_header=True, chunk_size=256)
+    assert sum(len(sources) for sources, _, _ in chunks) == len(edges)
+
+
+def test_invalid_edge_lists(tmp_path):
+    path = tmp_path / 'edges.txt'
+    for text in ('1 2\n', '1 2 x\n', '1.5 2 3\n'):
+        path.write_text(text)
+        with pytest.raises(ValueError):
+            load_edge_list(path)
+    path.write_text('0 3 1\n')
+    with pytest.raises(ValueError):
+        load_edge_list(path, vertices=3)
+    path.write_text('# no edges\n')
+    assert load_edge_list(path).V == 0
+
+
+def test_snapshot_round_trip_and_truncation(tmp_path):
+    path = tmp_path / 'edges.txt'
+    write_edges(path, random_edges(30, 100, seed=1))
+    csr = load_edge_list(path)
+    snapshot = tmp_path / 'graph.csr'
+    save_snapshot(csr, snapshot)
+    loaded = load_snapshot(snapshot)
+    assert list(loaded.dijkstra(0)) == list(csr.dijkstra(0))
+
+    data = snapshot.read_bytes()
+    for length in (10, len(data) - 8):
+        (tmp_path / 'bad.csr').write_bytes(data[:length])
+        with pytest.raises(ValueError):
+            load_snapshot(tmp_path / 'bad.csr')
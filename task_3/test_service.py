@@ -0,0 +1,51 @@
+import asyncio
+import random
+
+import pytest
+
+from task_3.dijkstra import Graph
+from task_3.service import ShortestPathService
+
+
+def random_graph(vertices, seed=0):
+    rnd = random.Random(seed)
+    graph = Graph(vertices)
+    for _ in range(3 * vertices):
+        graph.add_edge(rnd.randrange(vertices), rnd.randrange(vertices), rnd.randint(1, 100))
+    return graph
+
+
+def test_distances_match_dijkstra():
+    graph = random_graph(300)
+
+    async def run():
+        async with ShortestPathService(graph, workers=1) as service:
+            return await asyncio.gather(*(service.distances(src) for src in (0, 1, 0, 2, 1)))
+
+    for src, row in zip((0, 1, 0, 2, 1), asyncio.run(run())):
+        expected = graph.dijkstra(src)
+        assert [row[v] for v in range(graph.V)] == [expected[v] for v in range(graph.V)]
+
+
+def test_request_cancelled_under_backpressure_does_not_block_its_source():
+    graph = random_graph(300)
+
+    async def run():
+        async with ShortestPathService(graph, window=0.2, max_batch=2, max_pending=1, workers=1) as service:
+            first = asyncio.create_task(service.distances(0))
+            # Збирач узяв перший запит і чекає вікно, тож черга на одне місце швидко заповнюється
+            await asyncio.sleep(0.05)
+            second = asyncio.create_task(service.distances(1))
+            blocked = asyncio.create_task(service.distances(5))
+            await asyncio.sleep(0.05)
+            assert not blocked.done()
+            blocked.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await blocked
+            assert 5 not in service._inflight
+            row = await asyncio.wait_for(service.distances(5), timeout=5)
+            await asyncio.gather(first, second)
+            return row
+
+    row = asyncio.run(run())
+    assert row[5] == 0
@@ -0,0 +1,86 @@
+import math
+import random
+
+import pytest
+
+from task_3.dijkstra import Graph, euclidean_heuristic
+
+
+def random_graph(vertices, edges, seed, integer=True):
+    rnd = random.Random(seed)
+    graph = Graph(vertices)
+    for _ in range(edges):
+        weight = rnd.randint(1, 20) if integer else rnd.uniform(0.5, 20)
+        graph.add_edge(rnd.randrange(vertices), rnd.randrange(vertices), weight)
+    return graph
+
+
+def grid_graph(side, seed):
+    # Ваги не менші за евклідову відстань, тож евристика A* допустима
+    rnd = random.Random(seed)
+    graph = Graph(side * side)
+    coords = {}
+    for row in range(side):
+        for col in range(side):
+            v = row * side + col
+            coords[v] = (col, row)
+            if col + 1 < side:
+                graph.add_edge(v, v + 1, 1 + rnd.random() * 3)
+            if row + 1 < side:
+                graph.add_edge(v, v + side, 1 + rnd.random() * 3)
+    return graph, coords
+
+
+def path_length(graph, path):
+    return sum(min(w for x, w in graph.graph[u] if x == v) for u, v in zip(path, path[1:]))
+
+
+def check_path(graph, src, dst, distance, path, expected):
+    if expected == math.inf:
+        assert (distance, path) == (math.inf, [])
+        return
+    assert distance == pytest.approx(expected)
+    assert path[0] == src and path[-1] == dst
+    assert path_length(graph, path) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize('method', ['dijkstra', 'bidirectional'])
+@pytest.mark.parametrize('integer', [True, False])
+def test_matches_full_dijkstra_on_random_graphs(method, integer):
+    for seed in range(5):
+        # Рідкий граф, щоб траплялися й недосяжні вершини
+        graph = random_graph(60, 55, seed, integer)
+        rnd = random.Random(seed)
+        for _ in range(20):
+            src, dst = rnd.randrange(graph.V), rnd.randrange(graph.V)
+            expected = graph.dijkstra(src)[dst]
+            distance, path = graph.shortest_path(src, dst, method=method)
+            check_path(graph, src, dst, distance, path, expected)
+
+
+def test_astar_matches_full_dijkstra_and_settles_fewer_vertices():
+    graph, coords = grid_graph(15, seed=1)
+    rnd = random.Random(1)
+    for _ in range(20):
+        src, dst = rnd.randrange(graph.V), rnd.randrange(graph.V)
+        expected = graph.dijkstra(src)[dst]
+        dijkstra_stats, astar_stats = {}, {}
+        graph.shortest_path(src, dst, stats=dijkstra_stats)
+        distance, path = graph.shortest_path(src, dst, method='astar',
+                                             heuristic=euclidean_heuristic(coords, dst), stats=astar_stats)
+        check_path(graph, src, dst, distance, path, expected)
+        assert astar_stats['settled'] <= dijkstra_stats['settled']
+
+
+def test_source_equals_target():
+    graph = random_graph(10, 20, seed=0)
+    for method in ('dijkstra', 'bidirectional'):
+        assert graph.shortest_path(3, 3, method=method) == (0, [3])
+
+
+def test_invalid_method():
+    graph = random_graph(10, 20, seed=0)
+    with pytest.raises(ValueError):
+        graph.shortest_path(0, 1, method='bfs')
+    with pytest.raises(ValueError):
+        graph.shortest_path(0, 1, method='astar')
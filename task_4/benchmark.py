@@ -0,0 +1,106 @@
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import matplotlib
+
+matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt
+import networkx as nx
+
+from task_4.draw_tree import add_edges, draw_tree, heapify
+from task_4.heap_tree import HeapTree
+from task_4.layout import to_networkx, tree_layout
+
+
+def measure(build, elements):
+    """
+    Measures build time and peak traced memory of a heap tree builder.
+
+    :param build: A callable that takes a list of elements and returns the tree.
+    :param elements: The elements to build the tree from.
+    :return: A tuple of (seconds, peak bytes).
+    """
+    data = list(elements)
+    tracemalloc.start()
+    start = time.perf_counter()
+    tree = build(data)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tree
+    return elapsed, peak
+
+
+def bench_build(sizes):
+    builders = [("Node heapify", heapify), ("HeapTree", HeapTree)]
+    print(f"{'N':>9} {'builder':<14} {'time, s':>10} {'peak, MB':>10}")
+    for n in sizes:
+        elements = [random.randrange(n) for _ in range(n)]
+        for name, build in builders:
+            elapsed, peak = measure(build, elements)
+            print(f"{n:>9} {name:<14} {elapsed:>10.3f} {peak / 2 ** 20:>10.1f}")
+
+
+def recursive_layout(root):
+    graph = nx.DiGraph()
+    pos = {}
+    add_edges(graph, root, pos)
+    return graph, pos
+
+
+def bench_layout(sizes):
+    """
+    Compares the recursive add_edges with the iterative layout, both producing a networkx graph and positions.
+
+    :param sizes: The tree sizes to try.
+    """
+    print(f"{'N':>9} {'layout':<18} {'time, s':>10}")
+    for n in sizes:
+        node_root = heapify(list(range(n)))
+        heap_root = HeapTree(range(n)).root
+        layouts = [
+            ("add_edges", recursive_layout, node_root),
+            ("tree_layout", lambda root: to_networkx(tree_layout(root)), node_root),
+            ("tree_layout only", tree_layout, node_root),
+            ("heap_layout", lambda root: to_networkx(tree_layout(root)), heap_root),
+            ("heap_layout only", tree_layout, heap_root),
+        ]
+        for name, layout, root in layouts:
+            start = time.perf_counter()
+            layout(root)
+            print(f"{n:>9} {name:<18} {time.perf_counter() - start:>10.3f}")
+
+
+def bench_render(sizes, networkx_limit=10 ** 4):
+    """
+    Compares headless rendering time of the networkx and the collections backends of draw_tree.
+
+    :param sizes: The tree sizes to try.
+    :param networkx_limit: The largest tree drawn with the networkx backend.
+    """
+    print(f"{'N':>9} {'backend':<12} {'time, s':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        for n in sizes:
+            root = HeapTree(range(n)).root
+            for backend in ('networkx', 'collections'):
+                if backend == 'networkx' and n > networkx_limit:
+                    continue
+                start = time.perf_counter()
+                draw_tree(root, backend=backend, path=os.path.join(directory, 'tree.png'))
+                print(f"{n:>9} {backend:<12} {time.perf_counter() - start:>10.3f}")
+                plt.close('all')
+
+
+if __name__ == '__main__':
+    max_power = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    sizes = [10 ** p for p in range(3, max_power + 1)]
+    bench_build(sizes)
+    print()
+    bench_layout(sizes)
+    print()
+    bench_render([10 ** p for p in range(2, max_power + 1)])
@@ -4,6 +4,10 @@ import uuid
 import matplotlib.pyplot as plt
 import networkx as nx
 
+from task_4.heap_tree import HeapTree
+from task_4.layout import to_networkx, tree_layout
+from task_4.render import render_layout
+
 
 class Node:
     """
@@ -76,26 +80,41 @@ def add_edges(graph, node, pos, x=0, y=0, layer=1):
     return graph
 
 
-def draw_tree(tree_root):
+def draw_tree(tree_root, backend='networkx', path=None):
     """
     :param tree_root: The root node of the tree.
+    :param backend: 'networkx' draws every node through nx.draw; 'collections' draws all edges and all nodes as two
+                    matplotlib collections, which stays fast for trees with hundreds of thousands of nodes.
+    :param path: If given, the image is saved to this file instead of being shown. With the 'collections' backend
+                 this does not need a display.
     :return: None
 
     This method takes the root node of a tree and draws the tree using networkx and matplotlib libraries. The tree is drawn as a directed graph, with nodes represented as circles. The position
-    * of each node is determined by its id attribute. The edges of the tree are added to the graph using the `add_edges` function. The colors and labels of the nodes are obtained from the
+    * of each node is computed by `tree_layout` in a single iterative pass, and the nodes and edges are added to the graph in bulk. The colors and labels of the nodes are obtained from the
     * attributes stored in the graph. The resulting graph is displayed using matplotlib.
     """
-    tree = nx.DiGraph()
-    pos = {tree_root.id: (0, 0)} if tree_root else {}
-    tree = add_edges(tree, tree_root, pos)
+    layout = tree_layout(tree_root)
+    if backend == 'collections':
+        render_layout(layout, path=path)
+        if path is None:
+            plt.show()
+        return
+    if backend != 'networkx':
+        raise ValueError(f"Unknown drawing backend: {backend}")
+
+    tree, pos = to_networkx(layout)
     colors = [node[1]['color'] for node in tree.nodes(data=True)]
     labels = {node[0]: node[1]['label'] for node in tree.nodes(data=True)}
     plt.figure(figsize=(8, 5))
     nx.draw(tree, pos=pos, labels=labels, arrows=False, node_size=2500, node_color=colors)
-    plt.show()
+    if path is None:
+        plt.show()
+    else:
+        plt.savefig(path)
+        plt.close()
 
 
 if __name__ == '__main__':
     nums = [1, 1, 2, 2, 2, 3, 4, 5, 7, 9, 34]
-    heap_root = heapify(nums)
+    heap_root = HeapTree(nums).root
     draw_tree(heap_root)
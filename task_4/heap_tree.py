@@ -0,0 +1,147 @@
+import heapq
+
+
+class HeapNode:
+    """
+    :class: HeapNode
+
+    HeapNode is a lightweight view of one slot of a HeapTree. It has the same attributes as Node
+    (left, right, val, color, id), so add_edges, draw_tree and the traversals work with it
+    unchanged, but it stores nothing except a reference to the tree and the slot index.
+
+    Attributes:
+        tree (HeapTree): The tree the node belongs to.
+        index (int): The position of the node in the heap array, also used as its id.
+    """
+    __slots__ = ('tree', 'index')
+
+    def __init__(self, tree, index):
+        self.tree = tree
+        self.index = index
+
+    @property
+    def id(self):
+        return self.index
+
+    @property
+    def val(self):
+        return self.tree.values[self.index]
+
+    @property
+    def color(self):
+        return self.tree.colors[self.index]
+
+    @color.setter
+    def color(self, value):
+        self.tree.colors[self.index] = value
+
+    @property
+    def left(self):
+        return self.tree.node(2 * self.index + 1)
+
+    @property
+    def right(self):
+        return self.tree.node(2 * self.index + 2)
+
+    def __eq__(self, other):
+        return isinstance(other, HeapNode) and other.tree is self.tree and other.index == self.index
+
+    def __hash__(self):
+        return hash((id(self.tree), self.index))
+
+    def __repr__(self):
+        return f"HeapNode({self.index}, {self.val!r})"
+
+
+class HeapTree:
+    """
+    :class: HeapTree
+
+    HeapTree is an implicit binary min-heap: values live in a flat list and the children of slot i
+    are the slots 2i+1 and 2i+2. Tree nodes are handed out as HeapNode views on demand, so the
+    tree always reflects the current heap after push, pop or replace. Colors are kept in a parallel
+    list and move together with their values, so a colored value stays colored wherever it goes.
+
+    Attributes:
+        values (list): The heap-ordered values.
+        colors (list): The color of the value in the same slot.
+        default_color (str): The color given to values pushed without one.
+
+    Methods:
+        push(value, color=None): Adds a value to the heap.
+        pop(): Removes and returns the smallest value.
+        replace(value, color=None): Pops the smallest value and pushes a new one in a single sift.
+        node(index): Returns the view of the slot, or None if the slot is empty.
+        root: The view of the root slot, or None for an empty heap.
+    """
+    def __init__(self, elements=(), color="skyblue"):
+        self.values = list(elements)
+        # Усі кольори однакові, тож купу можна будувати лише зі значень
+        heapq.heapify(self.values)
+        self.default_color = color
+        self.colors = [color] * len(self.values)
+
+    def __len__(self):
+        return len(self.values)
+
+    @property
+    def root(self):
+        return self.node(0)
+
+    def node(self, index):
+        return HeapNode(self, index) if index < len(self.values) else None
+
+    def push(self, value, color=None):
+        self.values.append(value)
+        self.colors.append(self.default_color if color is None else color)
+        self._sift_up(0, len(self.values) - 1)
+
+    def pop(self):
+        last = self.values.pop()
+        last_color = self.colors.pop()
+        if not self.values:
+            return last
+        smallest = self.values[0]
+        self.values[0], self.colors[0] = last, last_color
+        self._sift_down(0)
+        return smallest
+
+    def replace(self, value, color=None):
+        smallest = self.values[0]
+        self.values[0] = value
+        self.colors[0] = self.default_color if color is None else color
+        self._sift_down(0)
+        return smallest
+
+    def _sift_up(self, start, pos):
+        """
+        Moves the entry at pos towards start while it is smaller than its parent, as heapq does.
+        """
+        values, colors = self.values, self.colors
+        value, color = values[pos], colors[pos]
+        while pos > start:
+            parent = (pos - 1) >> 1
+            if not value < values[parent]:
+                break
+            values[pos], colors[pos] = values[parent], colors[parent]
+            pos = parent
+        values[pos], colors[pos] = value, color
+
+    def _sift_down(self, pos):
+        """
+        Restores the heap below pos the way heapq does: the smaller child is moved up all the way to a
+        leaf, and the entry from pos is put there and sifted back up, which needs fewer comparisons.
+        """
+        values, colors = self.values, self.colors
+        end = len(values)
+        start = pos
+        value, color = values[pos], colors[pos]
+        child = 2 * pos + 1
+        while child < end:
+            if child + 1 < end and not values[child] < values[child + 1]:
+                child += 1
+            values[pos], colors[pos] = values[child], colors[child]
+            pos = child
+            child = 2 * pos + 1
+        values[pos], colors[pos] = value, color
+        self._sift_up(start, pos)
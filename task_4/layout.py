@@ -0,0 +1,108 @@
+from array import array
+from collections import namedtuple
+
+import networkx as nx
+import numpy as np
+
+from task_4.heap_tree import HeapNode
+
+TreeLayout = namedtuple('TreeLayout', ['ids', 'labels', 'colors', 'x', 'y', 'edges'])
+TreeLayout.__doc__ = """
+Positions and edges of every node of a binary tree, in breadth-first order.
+
+ids, labels and colors are lists, x and y are float arrays, edges is an (N - 1, 2) integer array of
+(parent, child) positions in that order.
+"""
+
+
+def tree_layout(root):
+    """
+    Computes the position of every node of a binary tree in one iterative breadth-first pass.
+
+    The coordinates are the same as in add_edges: a child of a node at depth d is shifted by
+    1 / 2 ** (d + 1) to the left or right and placed one unit lower. There is no recursion, so
+    degenerate trees of any depth are fine. Trees made of HeapNode views take the closed-form
+    path of heap_layout.
+
+    :param root: The root node of the tree (any object with left, right, id, val and color).
+    :return: A TreeLayout.
+    """
+    if root is None:
+        return TreeLayout([], [], [], np.empty(0), np.empty(0), np.empty((0, 2), dtype=np.int64))
+    if isinstance(root, HeapNode) and root.index == 0:
+        tree = root.tree
+        x, y, edges = heap_layout(len(tree))
+        return TreeLayout(list(range(len(tree))), list(tree.values), list(tree.colors), x, y, edges)
+
+    # Перший прохід лише рахує вузли, щоб виділити масиви координат одразу потрібного розміру
+    count = 0
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        count += 1
+        if node.left:
+            stack.append(node.left)
+        if node.right:
+            stack.append(node.right)
+
+    nodes = [None] * count
+    x = array('d', bytes(8 * count))
+    y = array('d', bytes(8 * count))
+    edges = array('q', bytes(16 * (count - 1)))
+    steps = [0.5]
+    nodes[0] = root
+    tail = 1
+    for head in range(count):
+        node = nodes[head]
+        depth = int(-y[head])
+        if depth == len(steps):
+            steps.append(steps[-1] / 2)
+        step = steps[depth]
+        for child, shift in ((node.left, -step), (node.right, step)):
+            if child:
+                nodes[tail] = child
+                x[tail] = x[head] + shift
+                y[tail] = y[head] - 1
+                edges[2 * tail - 2] = head
+                edges[2 * tail - 1] = tail
+                tail += 1
+
+    return TreeLayout([node.id for node in nodes], [node.val for node in nodes], [node.color for node in nodes],
+                      np.frombuffer(x), np.frombuffer(y), np.frombuffer(edges, dtype=np.int64).reshape(-1, 2))
+
+
+def heap_layout(size):
+    """
+    Computes the positions of a complete binary tree stored as a heap, in closed form.
+
+    Slot i sits at depth d = floor(log2(i + 1)) and is the p-th node of its level, p = i + 1 - 2 ** d,
+    which gives x = (2p + 1) / 2 ** d - 1 and y = -d. The parent of slot i is (i - 1) // 2.
+
+    :param size: The number of nodes in the heap.
+    :return: A tuple of the x and y arrays and the (size - 1, 2) array of (parent, child) edges.
+    """
+    index = np.arange(size, dtype=np.int64)
+    # frexp дає точний показник степеня двійки без похибок log2
+    depth = np.frexp((index + 1).astype(np.float64))[1] - 1
+    level_start = np.left_shift(1, depth).astype(np.int64)
+    x = (2 * (index + 1 - level_start) + 1) / level_start - 1.0
+    y = -depth.astype(np.float64)
+    children = index[1:]
+    edges = np.column_stack(((children - 1) // 2, children))
+    return x, y, edges
+
+
+def to_networkx(layout):
+    """
+    Builds a networkx DiGraph and a positions dictionary from a layout with bulk insertions.
+
+    :param layout: A TreeLayout.
+    :return: A tuple of the graph and the positions dictionary.
+    """
+    ids = layout.ids
+    graph = nx.DiGraph()
+    graph.add_nodes_from((node_id, {'color': color, 'label': label})
+                         for node_id, color, label in zip(ids, layout.colors, layout.labels))
+    graph.add_edges_from((ids[parent], ids[child]) for parent, child in layout.edges.tolist())
+    pos = dict(zip(ids, zip(layout.x.tolist(), layout.y.tolist())))
+    return graph, pos
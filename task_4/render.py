@@ -0,0 +1,71 @@
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+
+NODE_SIZE = 2500
+LABEL_THRESHOLD = 200
+
+
+def render_layout(layout, path=None, ax=None, label_threshold=LABEL_THRESHOLD, node_size=None, figsize=(8, 5),
+                  dpi=100):
+    """
+    Draws a tree layout with two matplotlib artists: one LineCollection for all edges and one
+    scatter PathCollection for all nodes.
+
+    Labels are a level-of-detail feature: they are only drawn for the nodes inside the current view,
+    and only when there are at most label_threshold of them, so zooming into a big tree reveals the
+    labels of the zoomed-in part.
+
+    :param layout: A TreeLayout from task_4.layout.
+    :param path: If given, the tree is rendered headlessly with the Agg backend and saved to this file.
+    :param ax: The axes to draw on (default: a new figure).
+    :param label_threshold: The maximal number of visible nodes for which labels are drawn.
+    :param node_size: The marker area in points^2 (default: 2500, shrunk for trees above the threshold).
+    :param figsize: The size of a new figure in inches.
+    :param dpi: The resolution of a new figure.
+    :return: The node PathCollection (its figure and axes are available as .figure and .axes).
+    """
+    count = len(layout.ids)
+    if node_size is None:
+        node_size = NODE_SIZE if count <= label_threshold else max(1.0, NODE_SIZE * label_threshold / count)
+
+    if ax is None:
+        if path is not None:
+            figure = Figure(figsize=figsize, dpi=dpi)
+            FigureCanvasAgg(figure)
+            ax = figure.add_subplot()
+        else:
+            _, ax = plt.subplots(figsize=figsize, dpi=dpi)
+
+    points = np.column_stack((layout.x, layout.y))
+    if len(layout.edges):
+        segments = np.stack((points[layout.edges[:, 0]], points[layout.edges[:, 1]]), axis=1)
+        ax.add_collection(LineCollection(segments, colors="black", linewidths=1, zorder=1))
+    nodes = ax.scatter(layout.x, layout.y, s=node_size, c=layout.colors, zorder=2, clip_on=False)
+    ax.set_axis_off()
+    ax.margins(0.1)
+    ax.autoscale_view()
+
+    labels = []
+
+    def update_labels(axes):
+        for text in labels:
+            text.remove()
+        labels.clear()
+        (x_min, x_max), (y_min, y_max) = sorted(axes.get_xlim()), sorted(axes.get_ylim())
+        visible = np.flatnonzero((layout.x >= x_min) & (layout.x <= x_max) & (layout.y >= y_min) & (layout.y <= y_max))
+        if len(visible) > label_threshold:
+            return
+        for i in visible.tolist():
+            labels.append(axes.text(layout.x[i], layout.y[i], str(layout.labels[i]), ha='center', va='center',
+                                    zorder=3))
+
+    update_labels(ax)
+    ax.callbacks.connect('xlim_changed', update_labels)
+    ax.callbacks.connect('ylim_changed', update_labels)
+
+    if path is not None:
+        ax.figure.savefig(path)
+    return nodes
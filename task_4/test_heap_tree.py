@@ -0,0 +1,47 @@
+import heapq
+import random
+
+import pytest
+
+from task_4.heap_tree import HeapTree
+
+
+def test_operations_keep_the_same_order_as_heapq():
+    rnd = random.Random(0)
+    tree = HeapTree(rnd.sample(range(1000), 50))
+    reference = list(tree.values)
+    for _ in range(500):
+        action = rnd.random()
+        if action < 0.4:
+            value = rnd.randrange(1000)
+            tree.push(value)
+            heapq.heappush(reference, value)
+        elif action < 0.7 and reference:
+            assert tree.pop() == heapq.heappop(reference)
+        elif reference:
+            value = rnd.randrange(1000)
+            assert tree.replace(value) == heapq.heapreplace(reference, value)
+        assert tree.values == reference
+        assert len(tree.colors) == len(reference)
+
+
+def test_colors_move_with_their_values():
+    tree = HeapTree([5, 7, 9, 11])
+    tree.node(tree.values.index(9)).color = "red"
+    tree.push(1, color="green")
+    tree.push(8)
+    assert tree.pop() == 1
+    tree.replace(20, color="blue")
+    assert tree.pop() == 7
+    for value, color in zip(tree.values, tree.colors):
+        assert color == {9: "red", 20: "blue"}.get(value, "skyblue")
+    assert tree.root.val == 8 and tree.root.color == "skyblue"
+
+
+def test_empty_heap():
+    tree = HeapTree()
+    assert tree.root is None
+    with pytest.raises(IndexError):
+        tree.pop()
+    with pytest.raises(IndexError):
+        tree.replace(1)
@@ -0,0 +1,91 @@
+import math
+import os
+
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.animation import FFMpegWriter, FuncAnimation, PillowWriter
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from task_4.layout import tree_layout
+from task_4.render import render_layout
+from task_5.traversal import TRAVERSAL_CMAP, order_colors, traverse
+
+
+def traversal_painter(root, ax, method='bfs', steps_per_frame=1, cmap=TRAVERSAL_CMAP):
+    """
+    Draws a tree once and returns a function that paints the traversal frame by frame.
+
+    Every frame writes the colors of the nodes visited during its steps into a face-color array and
+    hands that array to the existing node collection. Nothing is re-laid-out or recreated, and with
+    blitting only the node collection is redrawn.
+
+    :param root: The root node of the tree.
+    :param ax: The axes to draw the tree on.
+    :param method: The traversal method, see task_5.traversal.traverse.
+    :param steps_per_frame: How many visited nodes are painted per frame.
+    :param cmap: The colormap the visit order is mapped onto.
+    :return: A tuple of the update function (frame number -> tuple of changed artists) and the number of frames.
+    """
+    layout = tree_layout(root)
+    position = {node_id: i for i, node_id in enumerate(layout.ids)}
+    order = np.fromiter((position[node.id] for node in traverse(root, method)), dtype=np.int64, count=len(layout.ids))
+    colors = order_colors(len(order), cmap)
+
+    nodes = render_layout(layout, ax=ax)
+    face_colors = np.broadcast_to(nodes.get_facecolor(), (len(order), 4)).copy()
+
+    def update(frame):
+        visited = slice(frame * steps_per_frame, (frame + 1) * steps_per_frame)
+        face_colors[order[visited]] = colors[visited]
+        # Колекція лише отримує оновлений масив кольорів; розкладка і решта фігури не змінюються
+        nodes.set_facecolor(face_colors)
+        return nodes,
+
+    return update, max(1, math.ceil(len(order) / steps_per_frame))
+
+
+def animate_traversal(root, method='bfs', path=None, fps=30, steps_per_frame=1, cmap=TRAVERSAL_CMAP, figsize=(8, 5),
+                      dpi=100):
+    """
+    Shows or saves an animation of a tree traversal.
+
+    :param root: The root node of the tree.
+    :param method: The traversal method, see task_5.traversal.traverse.
+    :param path: Where to save the animation: a '.gif' or '.mp4' file, or a PNG file name pattern with a
+                 frame number placeholder such as 'frames/bfs_%05d.png'. If None, the animation is shown on screen.
+    :param fps: The frame rate.
+    :param steps_per_frame: How many visited nodes are painted per frame.
+    :param cmap: The colormap the visit order is mapped onto.
+    :param figsize: The figure size in inches.
+    :param dpi: The resolution of saved frames.
+    :return: None
+    """
+    extension = os.path.splitext(path)[1].lower() if path is not None else None
+    png_sequence = extension == '.png' and '%' in path
+    if extension not in (None, '.gif', '.mp4') and not png_sequence:
+        raise ValueError(f"Unsupported animation output: {path}")
+
+    if path is None:
+        figure = plt.figure(figsize=figsize)
+    else:
+        figure = Figure(figsize=figsize, dpi=dpi)
+        FigureCanvasAgg(figure)
+    update, frames = traversal_painter(root, figure.add_subplot(), method, steps_per_frame, cmap)
+
+    if png_sequence:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        for frame in range(frames):
+            update(frame)
+            figure.savefig(path % frame)
+        return
+
+    animation = FuncAnimation(figure, update, frames=frames, interval=1000 / fps, blit=True, repeat=False)
+    if path is None:
+        plt.show()
+    elif extension == '.gif':
+        animation.save(path, writer=PillowWriter(fps=fps))
+    else:
+        animation.save(path, writer=FFMpegWriter(fps=fps))
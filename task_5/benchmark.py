@@ -0,0 +1,36 @@
+import sys
+import time
+
+from task_4.heap_tree import HeapTree
+from task_5.color_draw import traverse_and_color
+from task_5.traversal import TRAVERSALS, level_order
+
+
+def bench_traversals(size):
+    """
+    Measures traversal throughput and the cost of coloring a tree of the given size.
+
+    :param size: The number of nodes.
+    """
+    root = HeapTree(range(size)).root
+    print(f"{size} вузлів")
+    print(f"{'traversal':<12} {'time, s':>10} {'nodes/s':>12}")
+    for name, traversal in TRAVERSALS.items():
+        start = time.perf_counter()
+        count = sum(1 for _ in traversal(root))
+        elapsed = time.perf_counter() - start
+        print(f"{name:<12} {elapsed:>10.3f} {count / elapsed:>12.0f}")
+
+    start = time.perf_counter()
+    count = sum(len(level) for level in level_order(root))
+    elapsed = time.perf_counter() - start
+    print(f"{'level_order':<12} {elapsed:>10.3f} {count / elapsed:>12.0f}")
+
+    start = time.perf_counter()
+    traverse_and_color(root, 'bfs')
+    elapsed = time.perf_counter() - start
+    print(f"{'bfs + color':<12} {elapsed:>10.3f} {size / elapsed:>12.0f}")
+
+
+if __name__ == '__main__':
+    bench_traversals(int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6)
@@ -1,10 +1,13 @@
 import heapq
 import uuid
-from collections import deque
 
 import matplotlib.pyplot as plt
 import networkx as nx
 
+from task_4.heap_tree import HeapTree
+from task_4.layout import to_networkx, tree_layout
+from task_5.traversal import TRAVERSAL_CMAP, order_colors, traverse
+
 
 class Node:
     """
@@ -96,59 +99,38 @@ def draw_tree(tree, pos, labels, node_colors):
     plt.show()
 
 
-def traverse_and_color(graph, method='bfs'):
+def traverse_and_color(root, method='bfs', cmap=TRAVERSAL_CMAP):
     """
-    :param graph: The graph to traverse and color.
-    :param method: The traversal method to use. Can be either 'bfs' (Breadth-First Search) or 'dfs' (Depth-First Search). Default is 'bfs'.
-    :return: A dictionary mapping each node's ID to its assigned color.
-
-    Traverses the given graph using the specified method and assigns a color to each node. The color values are generated based on the node's position in the traversal order.
+    :param root: The root node of the tree to traverse and color.
+    :param method: The traversal method to use: 'bfs' (Breadth-First Search), 'dfs' (Depth-First Search, pre-order),
+                   'preorder', 'inorder' or 'postorder'. Default is 'bfs'.
+    :param cmap: The matplotlib colormap the visit order is mapped onto.
+    :return: A dictionary mapping each node's ID to its assigned RGBA color.
 
-    The graph should be provided as a data structure compatible with the traversal algorithm used (e.g., adjacency list for BFS, adjacency matrix for DFS).
+    Traverses the tree from the given root using the specified method and assigns a color to each node. The traversal
+    is lazy (see task_5.traversal), and the colors for all nodes are produced in a single vectorized colormap lookup,
+    so the first visited node gets the darkest color and the last visited node the lightest one.
 
     Examples:
-        graph = ...  # construct the graph
-        color_map = traverse_and_color(graph)  # Use BFS as the default traversal method
-        color_map = traverse_and_color(graph, 'dfs')  # Use DFS as the traversal method
-
-    Note:
-        - The traversal order may vary depending on the graph structure and traversal method.
-        - The assigned colors are hexadecimal RGB values in the format "#RRGGBB".
-        - The color values are generated based on the node's position in the traversal order, with decreasing red (RR) values and increasing green (GG) values.
-        - The blue (BB) value is set to a constant value of 180.
-
+        color_map = traverse_and_color(heap_root)  # Use BFS as the default traversal method
+        color_map = traverse_and_color(heap_root, 'dfs')  # Use DFS as the traversal method
     """
-    queue = deque([heap_root]) if method == 'bfs' else [heap_root]
-    colors = []
-    color_map = {}
-    i = 0
-    while queue:
-        node = queue.popleft() if method == 'bfs' else queue.pop()
-        if node and node.id not in color_map:
-            color_value = "#{:02x}{:02x}{:02x}".format(255 - i * 10, 105 + i * 10 % 150, 180)
-            color_map[node.id] = color_value
-            colors.append(color_value)
-            i += 1
-            if method == 'bfs':
-                queue.extend([node.left, node.right])
-            else:  # DFS uses stack, so we add right first to visit left first
-                queue.extend([child for child in [node.right, node.left] if child])
-    return color_map
+    order = [node.id for node in traverse(root, method)]
+    return dict(zip(order, order_colors(len(order), cmap).tolist()))
 
 
 if __name__ == '__main__':
     nums = [1, 1, 2, 2, 2, 3, 4, 5, 7, 9, 34]
-    heap_root = heapify(nums)
+    heap_root = HeapTree(nums).root
 
     # Build the tree and positions
-    tree = nx.DiGraph()
-    pos = add_edges(tree, heap_root, {})
+    tree, pos = to_networkx(tree_layout(heap_root))
     labels = {node[0]: node[1]['label'] for node in tree.nodes(data=True)}
 
     # BFS traversal and coloring
-    bfs_colors = traverse_and_color(tree, method='bfs')
+    bfs_colors = traverse_and_color(heap_root, method='bfs')
     draw_tree(tree, pos, labels, [bfs_colors[node] for node in tree.nodes()])
 
     # DFS traversal and coloring
-    dfs_colors = traverse_and_color(tree, method='dfs')
+    dfs_colors = traverse_and_color(heap_root, method='dfs')
     draw_tree(tree, pos, labels, [dfs_colors[node] for node in tree.nodes()])
@@ -0,0 +1,129 @@
+from collections import deque
+
+import numpy as np
+from matplotlib.colors import LinearSegmentedColormap
+
+# Від темного до світлого: чим раніше вузол відвідано, тим темніший колір
+TRAVERSAL_CMAP = LinearSegmentedColormap.from_list('traversal', ['#0b2447', '#b0e0ff'])
+
+
+def bfs(root):
+    """
+    Yields the nodes of a binary tree in breadth-first order.
+
+    :param root: The root node (any object with left and right attributes), or None.
+    :return: A generator of nodes. The queue never holds more than two levels of the tree.
+    """
+    if root is None:
+        return
+    queue = deque([root])
+    while queue:
+        node = queue.popleft()
+        yield node
+        if node.left:
+            queue.append(node.left)
+        if node.right:
+            queue.append(node.right)
+
+
+def level_order(root):
+    """
+    Yields the levels of a binary tree one by one.
+
+    :param root: The root node, or None.
+    :return: A generator of lists of nodes, one list per depth.
+    """
+    level = [root] if root is not None else []
+    while level:
+        yield level
+        level = [child for node in level for child in (node.left, node.right) if child]
+
+
+def preorder(root):
+    """
+    Yields the nodes of a binary tree in depth-first pre-order (node, left, right).
+
+    :param root: The root node, or None.
+    :return: A generator of nodes. The stack holds O(height) nodes.
+    """
+    stack = [root] if root is not None else []
+    while stack:
+        node = stack.pop()
+        yield node
+        # Правого нащадка кладемо першим, щоб лівий вийшов зі стеку раніше
+        if node.right:
+            stack.append(node.right)
+        if node.left:
+            stack.append(node.left)
+
+
+def inorder(root):
+    """
+    Yields the nodes of a binary tree in depth-first in-order (left, node, right).
+
+    :param root: The root node, or None.
+    :return: A generator of nodes. The stack holds O(height) nodes.
+    """
+    stack = []
+    node = root
+    while stack or node:
+        while node:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        yield node
+        node = node.right
+
+
+def postorder(root):
+    """
+    Yields the nodes of a binary tree in depth-first post-order (left, right, node).
+
+    :param root: The root node, or None.
+    :return: A generator of nodes. The stack holds O(height) nodes.
+    """
+    stack = []
+    node = root
+    last = None
+    while stack or node:
+        while node:
+            stack.append(node)
+            node = node.left
+        top = stack[-1]
+        if top.right and top.right != last:
+            node = top.right
+        else:
+            last = stack.pop()
+            yield last
+
+
+TRAVERSALS = {
+    'bfs': bfs,
+    'dfs': preorder,
+    'preorder': preorder,
+    'inorder': inorder,
+    'postorder': postorder,
+}
+
+
+def traverse(root, method='bfs'):
+    """
+    :param root: The root node of the tree.
+    :param method: One of 'bfs', 'dfs' (same as 'preorder'), 'preorder', 'inorder' or 'postorder'.
+    :return: A generator of nodes in the requested order.
+    """
+    try:
+        return TRAVERSALS[method](root)
+    except KeyError:
+        raise ValueError(f"Unknown traversal method: {method}") from None
+
+
+def order_colors(count, cmap=TRAVERSAL_CMAP):
+    """
+    Maps visit ranks 0..count-1 to colors of a colormap in one vectorized call.
+
+    :param count: The number of visited nodes.
+    :param cmap: A matplotlib colormap.
+    :return: An array of shape (count, 4) with RGBA colors, the first row for the first visited node.
+    """
+    return cmap(np.linspace(0.0, 1.0, count))
@@ -0,0 +1,151 @@
+import random
+import sys
+import time
+import tracemalloc
+
+from task_6.greedy_dynamic import dynamic_programming, greedy_algorithm
+from task_6.knapsack import clear_solved_tables, dynamic_programming_rolling, solve_budgets
+from task_6.solver import DP_CELL_LIMIT, solve
+from task_6.streaming import greedy_stream
+
+
+def random_items(count, max_cost, seed=0):
+    rnd = random.Random(seed)
+    return {f"item{i}": {'cost': rnd.randint(1, max_cost), 'calories': rnd.randint(1, 1000)} for i in range(count)}
+
+
+def measure(solve, items, budget):
+    """
+    Measures run time and peak traced memory of a solver.
+
+    :param solve: A callable taking (items, budget).
+    :param items: The item catalog.
+    :param budget: The budget.
+    :return: A tuple of (seconds, peak bytes, result).
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = solve(items, budget)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+
+def bench_dp(cases, table_limit=2 * 10 ** 6):
+    """
+    Compares the full-table dynamic_programming with the rolling-row NumPy solver.
+
+    :param cases: (items count, budget) pairs.
+    :param table_limit: The largest n * budget for which the full-table solver is run.
+    """
+    print(f"{'items':>7} {'budget':>9} {'solver':<10} {'time, s':>10} {'peak, MB':>10}")
+    for count, budget in cases:
+        items = random_items(count, max(1, budget // 10))
+        solvers = [("table", dynamic_programming), ("rolling", dynamic_programming_rolling)]
+        for name, solve in solvers:
+            if solve is dynamic_programming and count * budget > table_limit:
+                continue
+            elapsed, peak, _ = measure(solve, items, budget)
+            print(f"{count:>7} {budget:>9} {name:<10} {elapsed:>10.3f} {peak / 2 ** 20:>10.1f}")
+
+
+def bench_budgets(count, budgets):
+    """
+    Compares per-budget solving with one batch DP pass, cold and with the solved table cached.
+
+    :param count: The number of items.
+    :param budgets: The budgets to answer.
+    """
+    items = random_items(count, max(1, max(budgets) // 10))
+    clear_solved_tables()
+    runs = [
+        ("per budget", lambda: [dynamic_programming_rolling(items, budget) for budget in budgets]),
+        ("batch, cold", lambda: solve_budgets(items, budgets)),
+        ("batch, cached", lambda: solve_budgets(items, budgets)),
+    ]
+    print(f"{count} предметів, {len(budgets)} бюджетів")
+    print(f"{'mode':<14} {'time, s':>10}")
+    for name, run in runs:
+        start = time.perf_counter()
+        run()
+        print(f"{name:<14} {time.perf_counter() - start:>10.3f}")
+
+
+def bench_engines(counts, scales, seed=5):
+    """
+    Shows where the DP and the branch-and-bound engines of solve win as the cost scale grows.
+
+    Two catalog families are used: uncorrelated calories, where the LP bound prunes almost
+    everything, and strongly correlated ones (calories = cost + scale / 10), the classic hard case
+    for branch and bound.
+
+    :param counts: The item counts to try.
+    :param scales: The cost scales, e.g. 100 for prices in whole units and 10 ** 7 for prices in cents.
+    :param seed: The random seed.
+    """
+    rnd = random.Random(seed)
+    print(f"{'family':<11} {'items':>6} {'scale':>9} {'engine':<6} {'time, s':>10}")
+    for family in ('random', 'correlated'):
+        for count in counts:
+            for scale in scales:
+                items = {}
+                for i in range(count):
+                    cost = rnd.randint(scale // 10 + 1, scale)
+                    calories = rnd.randint(1, 1000) if family == 'random' else cost + scale // 10
+                    items[f"item{i}"] = {'cost': cost, 'calories': calories, 'quantity': rnd.randint(1, 3)}
+                budget = scale * count // 4
+                for engine in ('dp', 'bnb'):
+                    if engine == 'dp' and 2 * count * (budget + 1) > DP_CELL_LIMIT:
+                        print(f"{family:<11} {count:>6} {scale:>9} {engine:<6} {'-':>10}")
+                        continue
+                    start = time.perf_counter()
+                    solve(items, budget, engine=engine)
+                    print(f"{family:<11} {count:>6} {scale:>9} {engine:<6} {time.perf_counter() - start:>10.3f}")
+
+
+def random_rows(count, max_cost, seed=0):
+    rnd = random.Random(seed)
+    for i in range(count):
+        yield f"item{i}", rnd.randint(1, max_cost), rnd.randint(1, 1000)
+
+
+def bench_greedy(counts, budget=10 ** 5, catalog_limit=10 ** 6):
+    """
+    Compares greedy_algorithm over an in-memory catalog with greedy_stream.
+
+    The catalogs are built before measuring, so the peak memory is the working memory of the
+    selection itself. Above catalog_limit items the catalog is not built at all: greedy_stream
+    reads freshly generated rows, and greedy_algorithm is skipped.
+
+    :param counts: The item counts to try.
+    :param budget: The budget.
+    :param catalog_limit: The largest item count for which the catalog is kept in memory.
+    """
+    print(f"{'items':>9} {'solver':<16} {'time, s':>10} {'peak, MB':>10}")
+    for count in counts:
+        if count <= catalog_limit:
+            rows = list(random_rows(count, 1000))
+            items = {name: {'cost': cost, 'calories': calories} for name, cost, calories in rows}
+            runs = [("greedy_algorithm", greedy_algorithm, items),
+                    ("greedy_stream", greedy_stream, lambda: iter(rows))]
+        else:
+            runs = [("greedy_stream", greedy_stream, lambda: random_rows(count, 1000))]
+        results = set()
+        for name, select, catalog in runs:
+            elapsed, peak, (chosen, calories) = measure(select, catalog, budget)
+            results.add((tuple(chosen), calories))
+            print(f"{count:>9} {name:<16} {elapsed:>10.3f} {peak / 2 ** 20:>10.1f}")
+        assert len(results) == 1
+
+
+if __name__ == '__main__':
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    scale = int(args[0]) if args else 1
+    bench_dp([(100, 1000), (1000, 1000), (1000, 10000), (2000 * scale, 100000 * scale)])
+    print()
+    bench_budgets(1000 * scale, range(10, 10001, 10))
+    print()
+    bench_engines([20, 40], [10, 1000, 10 ** 5, 10 ** 7])
+    print()
+    bench_greedy([10 ** 6] + ([10 ** 7] if '--huge' in sys.argv else []))
@@ -1,3 +1,7 @@
+import math
+from itertools import accumulate
+
+
 def greedy_algorithm(items, budget):
     """
     Selects items greedily based on the cost-to-calories ratio until the budget is exceeded.
@@ -13,14 +17,20 @@ def greedy_algorithm(items, budget):
     :param budget: The maximum budget to spend.
     :return: A tuple containing a list of chosen item names and the total calories of the chosen items.
     """
-    cost_per_calorie = {item: (info['calories'] / info['cost']) for item, info in items.items()}
+    # Безкоштовні предмети мають нескінченне співвідношення і йдуть першими
+    cost_per_calorie = {item: (info['calories'] / info['cost'] if info['cost'] else math.inf)
+                        for item, info in items.items()}
     sorted_items = sorted(cost_per_calorie.items(), key=lambda x: x[1], reverse=True)
+    # Найменша вартість серед предметів, що лишилися: коли бюджет менший за неї, далі нічого не влізе
+    cheapest_left = list(accumulate((items[item]['cost'] for item, _ in reversed(sorted_items)), min))[::-1]
 
     total_cost = 0
     total_calories = 0
     chosen_items = []
 
-    for item, _ in sorted_items:
+    for (item, _), cheapest in zip(sorted_items, cheapest_left):
+        if budget - total_cost < cheapest:
+            break
         if total_cost + items[item]['cost'] <= budget:
             chosen_items.append(item)
             total_cost += items[item]['cost']
@@ -54,7 +64,7 @@ def dynamic_programming(items, budget):
     n = len(items)
     chosen_items = []
 
-    while w >= 0 and n >= 0:
+    while w >= 0 and n > 0:
         if dp[n][w] != dp[n - 1][w]:
             chosen_items.append(item_list[n - 1])
             w -= items[item_list[n - 1]]['cost']
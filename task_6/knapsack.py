@@ -0,0 +1,137 @@
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+# Розв'язані таблиці за відбитком каталогу: fingerprint -> (budget, dp, decisions)
+SOLVED_CACHE_SIZE = 8
+_solved_tables = OrderedDict()
+
+
+def knapsack_table(costs, calories, budget):
+    """
+    Runs the 0/1 knapsack DP over a single rolling row, one vectorized update per item.
+
+    Instead of the full (n + 1) x (budget + 1) value table only the current row is kept; for item i
+    the row is updated as row[c:] = max(row[c:], row[:-c] + v), computed from the previous row in
+    one NumPy operation. Whether item i was taken at capacity w is remembered as one bit, so the
+    decisions for all items take n * (budget + 1) / 8 bytes.
+
+    :param costs: A sequence of non-negative integer item costs.
+    :param calories: A sequence of item calories.
+    :param budget: The maximum budget.
+    :return: A tuple of the final DP row (best calories for every capacity 0..budget) and the bit-packed
+             decision matrix of shape (n, ceil((budget + 1) / 8)).
+    """
+    values = np.asarray(calories)
+    dp = np.zeros(budget + 1, dtype=np.result_type(values.dtype, np.int64))
+    decisions = np.zeros((len(costs), (budget + 8) // 8), dtype=np.uint8)
+    taken = np.zeros(budget + 1, dtype=bool)
+
+    for i, (cost, value) in enumerate(zip(costs, values)):
+        if cost > budget or value <= 0:
+            continue
+        if cost == 0:
+            dp += value
+            decisions[i] = 0xFF
+            continue
+        candidate = dp[:budget + 1 - cost] + value
+        taken[:cost] = False
+        np.greater(candidate, dp[cost:], out=taken[cost:])
+        np.maximum(dp[cost:], candidate, out=dp[cost:])
+        decisions[i] = np.packbits(taken)
+
+    return dp, decisions
+
+
+def reconstruct(decisions, costs, capacity):
+    """
+    Walks the decision bits backwards to recover the chosen items.
+
+    :param decisions: The bit-packed decision matrix from knapsack_table.
+    :param costs: The item costs used to build it.
+    :param capacity: The capacity to reconstruct the selection for (any value up to the DP budget).
+    :return: The indices of the chosen items, last item first.
+    """
+    chosen = []
+    w = capacity
+    for i in range(len(costs) - 1, -1, -1):
+        if (decisions[i, w >> 3] >> (7 - (w & 7))) & 1:
+            chosen.append(i)
+            w -= costs[i]
+    return chosen
+
+
+def dynamic_programming_rolling(items, budget):
+    """
+    Finds the optimal selection of items with maximum total calories within a given budget, like
+    dynamic_programming, but in O(budget) value memory with vectorized row updates.
+
+    :param items: A dictionary where the keys are the names of the items and the values are dictionaries
+        with 'cost' and 'calories' representing the cost and calories of the item, respectively.
+    :param budget: The maximum budget available.
+    :return: A tuple containing a list of selected items and the maximum total calories.
+    """
+    item_list = list(items.keys())
+    costs = [items[item]['cost'] for item in item_list]
+    calories = [items[item]['calories'] for item in item_list]
+    dp, decisions = knapsack_table(costs, calories, budget)
+    chosen_items = [item_list[i] for i in reconstruct(decisions, costs, budget)]
+    return chosen_items, dp[budget].item()
+
+
+def catalog_fingerprint(items):
+    """
+    Computes a stable fingerprint of an item catalog: names, costs and calories in catalog order.
+
+    :param items: A dictionary of items in the same format as for dynamic_programming.
+    :return: A hex digest string.
+    """
+    digest = hashlib.sha1()
+    for name, info in items.items():
+        digest.update(repr((name, info['cost'], info['calories'])).encode())
+    return digest.hexdigest()
+
+
+def solve_budgets(items, budgets):
+    """
+    Finds the optimal selection of items for many budgets with a single DP pass.
+
+    The final DP row already holds the best calories for every capacity up to the largest budget,
+    and the decision bits allow reconstructing the selection from any capacity, so one run for
+    max(budgets) answers all of them. The solved table is cached by catalog fingerprint, so later
+    calls for the same catalog and budgets up to the cached one skip the DP entirely.
+
+    :param items: A dictionary of items in the same format as for dynamic_programming.
+    :param budgets: An iterable of non-negative integer budgets.
+    :return: A dictionary mapping every budget to a tuple of the selected items and their total calories.
+    """
+    budgets = list(budgets)
+    if not budgets:
+        return {}
+    item_list = list(items.keys())
+    costs = [items[item]['cost'] for item in item_list]
+
+    key = catalog_fingerprint(items)
+    entry = _solved_tables.get(key)
+    if entry is None or entry[0] < max(budgets):
+        calories = [items[item]['calories'] for item in item_list]
+        dp, decisions = knapsack_table(costs, calories, max(budgets))
+        entry = (max(budgets), dp, decisions)
+        _solved_tables[key] = entry
+        if len(_solved_tables) > SOLVED_CACHE_SIZE:
+            _solved_tables.popitem(last=False)
+    _solved_tables.move_to_end(key)
+
+    _, dp, decisions = entry
+    return {budget: ([item_list[i] for i in reconstruct(decisions, costs, budget)], dp[budget].item())
+            for budget in budgets}
+
+
+def clear_solved_tables():
+    """
+    Drops all cached DP tables.
+
+    :return: None
+    """
+    _solved_tables.clear()
@@ -0,0 +1,171 @@
+import math
+import numbers
+
+from task_6.knapsack import knapsack_table, reconstruct
+
+# Найбільша кількість клітинок DP (частини предметів x (бюджет + 1)), за якої обираємо DP замість B&B
+DP_CELL_LIMIT = 10 ** 8
+
+
+def solve(items, limits, objective='calories', unbounded=False, engine='auto'):
+    """
+    Finds the selection of items with the maximum total objective that fits all the limits.
+
+    Items may be taken several times: up to info['quantity'] times (default 1), or any number of
+    times when unbounded is True. Every key of limits is a constraint that every item has to
+    define, e.g. {'cost': 100, 'weight': 30}.
+
+    Two engines are available. 'dp' handles a single integer constraint: quantities are split into
+    binary parts (1, 2, 4, ...) and solved by the rolling-row 0/1 DP. 'bnb' is a depth-first
+    branch and bound that handles any constraints and any magnitudes; it explores items in the
+    same calories-per-cost order as greedy_algorithm and bounds every branch with the fractional
+    (LP) relaxation of that order. 'auto' picks 'dp' when it applies and its table stays below
+    DP_CELL_LIMIT cells, and 'bnb' otherwise.
+
+    :param items: A dictionary of items, where the value of each item is a dictionary with the objective, a value for
+                  every constrained key and an optional 'quantity'.
+    :param limits: A dictionary mapping constraint keys to their limits, or a number as a shorthand for {'cost': number}.
+    :param objective: The key of the value to maximize.
+    :param unbounded: If True, quantities are ignored and every item can be taken any number of times.
+    :param engine: 'auto', 'dp' or 'bnb'.
+    :return: A tuple containing a dictionary of chosen item names with their counts and the total objective.
+    """
+    if isinstance(limits, numbers.Number):
+        limits = {'cost': limits}
+    keys = list(limits)
+    primary = 'cost' if 'cost' in limits else keys[0]
+    names = list(items)
+    values = [items[name][objective] for name in names]
+    usages = [tuple(items[name][key] for key in keys) for name in names]
+    counts = [_max_count(items[name], usage, limits, keys, unbounded) if value > 0 else 0
+              for name, value, usage in zip(names, values, usages)]
+    for name, value, count in zip(names, values, counts):
+        if value > 0 and count == math.inf:
+            raise ValueError(f"Unbounded item {name!r} uses none of the limits")
+
+    if engine == 'auto':
+        engine = 'dp' if _dp_cells(usages, counts, limits, keys) <= DP_CELL_LIMIT else 'bnb'
+    if engine == 'dp':
+        if len(keys) != 1:
+            raise ValueError("The DP engine supports a single constraint")
+        chosen, total = _solve_dp(values, [usage[0] for usage in usages], counts, limits[primary])
+    elif engine == 'bnb':
+        chosen, total = _solve_bnb(values, usages, counts, [limits[key] for key in keys], keys.index(primary))
+    else:
+        raise ValueError(f"Unknown knapsack engine: {engine}")
+
+    return {names[i]: count for i, count in chosen.items() if count}, total
+
+
+def _max_count(info, usage, limits, keys, unbounded):
+    count = math.inf if unbounded else info.get('quantity', 1)
+    for amount, key in zip(usage, keys):
+        if amount > 0:
+            count = min(count, int(limits[key] // amount))
+    return count
+
+
+def _dp_cells(usages, counts, limits, keys):
+    if len(keys) != 1:
+        return math.inf
+    limit = limits[keys[0]]
+    if not isinstance(limit, numbers.Integral) or any(not isinstance(usage[0], numbers.Integral) for usage in usages):
+        return math.inf
+    parts = sum(max(1, int(count).bit_length()) for count in counts)
+    return parts * (limit + 1)
+
+
+def _split(count):
+    """
+    Splits a quantity into binary parts 1, 2, 4, ..., rest, which can be combined into any amount up to count.
+    """
+    part = 1
+    while count > 0:
+        taken = min(part, count)
+        yield taken
+        count -= taken
+        part *= 2
+
+
+def _solve_dp(values, costs, counts, budget):
+    owners, part_costs, part_values, multipliers = [], [], [], []
+    for i, (value, cost, count) in enumerate(zip(values, costs, counts)):
+        if value <= 0:
+            continue
+        for part in _split(count):
+            owners.append(i)
+            part_costs.append(cost * part)
+            part_values.append(value * part)
+            multipliers.append(part)
+
+    dp, decisions = knapsack_table(part_costs, part_values, budget)
+    chosen = {}
+    for j in reconstruct(decisions, part_costs, budget):
+        chosen[owners[j]] = chosen.get(owners[j], 0) + multipliers[j]
+    return chosen, dp[budget].item()
+
+
+def _solve_bnb(values, usages, counts, limits, primary):
+    # Той самий порядок, що й у greedy_algorithm: калорії на одиницю вартості, безкоштовні — першими
+    def ratio(i):
+        return math.inf if usages[i][primary] == 0 else values[i] / usages[i][primary]
+
+    order = sorted((i for i in range(len(values)) if values[i] > 0 and counts[i] > 0), key=ratio, reverse=True)
+    order_values = [values[i] for i in order]
+    order_usages = [usages[i] for i in order]
+    order_counts = [counts[i] for i in order]
+    size = len(order)
+
+    def bound(index, remaining, value):
+        budget = remaining[primary]
+        for j in range(index, size):
+            cost = order_usages[j][primary]
+            amount = order_counts[j]
+            if cost * amount <= budget:
+                value += order_values[j] * amount
+                budget -= cost * amount
+            else:
+                return value + order_values[j] * budget / cost
+        return value
+
+    def fits(index, remaining):
+        usage = order_usages[index]
+        return min([order_counts[index]] + [int(rest // amount) for rest, amount in zip(remaining, usage) if amount > 0])
+
+    # Початковий розв'язок — жадібний прохід у тому ж порядку
+    best_value = 0
+    remaining = list(limits)
+    path = None
+    for index in range(size):
+        count = fits(index, remaining)
+        if count:
+            remaining = [rest - amount * count for rest, amount in zip(remaining, order_usages[index])]
+            best_value += order_values[index] * count
+            path = (index, count, path)
+    best_path = path
+
+    # Кадр стеку: (індекс предмета, залишок лімітів, цінність, шлях, наступна кількість для перебору)
+    stack = [(0, tuple(limits), 0, None, None)]
+    while stack:
+        index, remaining, value, path, count = stack.pop()
+        if index == size:
+            if value > best_value:
+                best_value, best_path = value, path
+            continue
+        if count is None:
+            if bound(index, remaining, value) <= best_value:
+                continue
+            count = fits(index, remaining)
+        if count > 0:
+            stack.append((index, remaining, value, path, count - 1))
+            child_remaining = tuple(rest - amount * count for rest, amount in zip(remaining, order_usages[index]))
+            stack.append((index + 1, child_remaining, value + order_values[index] * count,
+                          (index, count, path), None))
+        else:
+            stack.append((index + 1, remaining, value, path, None))
+
+    chosen = {}
+    while best_path is not None:
+        index, count, best_path = best_path
+        chosen[order[index]] = count
+    return chosen, best_value
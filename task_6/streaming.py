@@ -0,0 +1,151 @@
+import csv
+from itertools import count, islice
+
+import numpy as np
+
+CHUNK_SIZE = 1 << 16
+POOL_SIZE = 1 << 16
+
+
+def read_items_csv(path, delimiter=','):
+    """
+    Streams items from a CSV file with 'name', 'cost' and 'calories' columns, one row at a time.
+
+    :param path: The path to the CSV file; the first row is the header.
+    :param delimiter: The field delimiter.
+    :return: A generator of (name, cost, calories) tuples.
+    """
+    with open(path, newline='') as file:
+        reader = csv.reader(file, delimiter=delimiter)
+        header = next(reader)
+        name_column, cost_column, calories_column = (header.index(column) for column in ('name', 'cost', 'calories'))
+        for row in reader:
+            if row:
+                yield row[name_column], _number(row[cost_column]), _number(row[calories_column])
+
+
+def _number(text):
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def greedy_stream(source, budget, chunk_size=CHUNK_SIZE, pool_size=POOL_SIZE):
+    """
+    Selects items like greedy_algorithm, but over a stream of items that never has to fit in memory.
+
+    Items are read in chunks of chunk_size; the calories-per-cost ratios of a chunk are computed in
+    one NumPy operation, and only the pool_size best candidates seen so far are kept (argpartition
+    over the pool and the new chunk). The pool is then filled greedily in ratio order, stopping as
+    soon as the remaining budget is below every remaining cost. If a dropped candidate could still
+    fit, the stream is read again for the candidates ranked after the pool and cheap enough for the
+    remaining budget only, so the chosen items and their order are exactly those of greedy_algorithm
+    with at most chunk_size + pool_size items in memory.
+
+    As in greedy_algorithm, items that cost nothing are taken first, in stream order, and items
+    without calories are ranked last but still taken while they fit.
+
+    :param source: An iterable of (name, cost, calories) tuples, e.g. from read_items_csv, or a callable
+                   returning a fresh one. A one-shot iterator only works if a single pass is enough.
+    :param budget: The maximum budget to spend.
+    :param chunk_size: The number of items processed per vectorized step.
+    :param pool_size: The number of best candidates kept between chunks.
+    :return: A tuple containing a list of chosen item names and the total calories of the chosen items.
+    """
+    chosen_items = []
+    total_calories = 0
+    remaining = budget
+    after = None
+    for pass_number in count():
+        stream = iter(source() if callable(source) else source)
+        if pass_number and stream is source:
+            raise ValueError("The stream has to be read again: pass a callable returning a fresh iterator "
+                             "or increase pool_size")
+        pool, dropped_cost, free = _collect(stream, remaining, after, chunk_size, pool_size, pass_number == 0)
+        for name, calories in free:
+            chosen_items.append(name)
+            total_calories += calories
+
+        names, costs, calories, ratios, order = pool
+        ranked = np.lexsort((order, -ratios))
+        costs, calories = costs[ranked], calories[ranked]
+        # Найменша вартість серед ще не розглянутих кандидатів для кожної позиції пулу
+        suffix_min = np.minimum.accumulate(costs[::-1])[::-1]
+        for i in range(len(ranked)):
+            if remaining < min(suffix_min[i], dropped_cost):
+                break
+            if costs[i] <= remaining:
+                chosen_items.append(names[ranked[i]])
+                total_calories += calories[i].item()
+                remaining -= costs[i].item()
+        if remaining < dropped_cost:
+            break
+        last = ranked[-1]
+        after = (ratios[last], order[last])
+
+    return chosen_items, total_calories
+
+
+def _collect(stream, remaining, after, chunk_size, pool_size, take_free):
+    """
+    Reads one pass over the stream and keeps the pool_size best candidates that could still be taken.
+
+    :return: A tuple of the pool (names, costs, calories, ratios, stream positions), the smallest cost of
+             the dropped candidates (inf if none) and the list of (name, calories) of free items.
+    """
+    names = np.empty(0, dtype=object)
+    costs = np.empty(0, dtype=np.int64)
+    calories = np.empty(0, dtype=np.int64)
+    ratios = np.empty(0)
+    order = np.empty(0, dtype=np.int64)
+    dropped_cost = np.inf
+    free = []
+    position = 0
+
+    while True:
+        rows = list(islice(stream, chunk_size))
+        if not rows:
+            break
+        chunk_names, chunk_costs, chunk_calories = zip(*rows)
+        chunk_costs = np.asarray(chunk_costs)
+        chunk_calories = np.asarray(chunk_calories)
+        chunk_order = np.arange(position, position + len(rows))
+        position += len(rows)
+
+        if take_free:
+            for i in np.flatnonzero(chunk_costs == 0).tolist():
+                free.append((chunk_names[i], chunk_calories[i].item()))
+        chunk_ratios = np.divide(chunk_calories, chunk_costs, out=np.zeros(len(rows)), where=chunk_costs > 0)
+        candidate = (chunk_costs > 0) & (chunk_costs <= remaining)
+        if after is not None:
+            ratio, index = after
+            candidate &= (chunk_ratios < ratio) | ((chunk_ratios == ratio) & (chunk_order > index))
+        keep = np.flatnonzero(candidate)
+
+        names = np.concatenate((names, np.array(chunk_names, dtype=object)[keep]))
+        costs = np.concatenate((costs, chunk_costs[keep]))
+        calories = np.concatenate((calories, chunk_calories[keep]))
+        ratios = np.concatenate((ratios, chunk_ratios[keep]))
+        order = np.concatenate((order, chunk_order[keep]))
+        if len(ratios) > pool_size:
+            best = _best(ratios, order, pool_size)
+            dropped = np.ones(len(ratios), dtype=bool)
+            dropped[best] = False
+            dropped_cost = min(dropped_cost, costs[dropped].min())
+            names, costs, calories, ratios, order = names[best], costs[best], calories[best], ratios[best], order[best]
+
+    return (names, costs, calories, ratios, order), dropped_cost, free
+
+
+def _best(ratios, order, count):
+    """
+    Picks the count candidates with the highest ratio, earlier stream positions first among equal ratios,
+    without sorting the whole array.
+    """
+    part = np.argpartition(-ratios, count - 1)[:count]
+    threshold = ratios[part].min()
+    above = np.flatnonzero(ratios > threshold)
+    ties = np.flatnonzero(ratios == threshold)
+    ties = ties[np.argsort(order[ties], kind='stable')[:count - len(above)]]
+    return np.concatenate((above, ties))
@@ -0,0 +1,28 @@
+import random
+
+import pytest
+
+from task_6.greedy_dynamic import greedy_algorithm
+from task_6.streaming import greedy_stream
+
+
+def random_rows(count, seed=0):
+    rnd = random.Random(seed)
+    # Є і безкоштовні предмети, і предмети без калорій
+    return [(f"item{i}", rnd.choice((0, rnd.randint(1, 100))), rnd.choice((0, rnd.randint(1, 1000))))
+            for i in range(count)]
+
+
+@pytest.mark.parametrize('budget', [0, 50, 5000, 10 ** 7])
+@pytest.mark.parametrize('chunk_size, pool_size', [(1 << 16, 1 << 16), (64, 16)])
+def test_greedy_stream_selects_the_same_items_as_greedy_algorithm(budget, chunk_size, pool_size):
+    rows = random_rows(2000)
+    items = {name: {'cost': cost, 'calories': calories} for name, cost, calories in rows}
+    expected = greedy_algorithm(items, budget)
+    assert greedy_stream(lambda: iter(rows), budget, chunk_size, pool_size) == expected
+
+
+def test_greedy_stream_rejects_second_pass_over_iterator():
+    rows = random_rows(2000)
+    with pytest.raises(ValueError):
+        greedy_stream(iter(rows), 10 ** 7, chunk_size=64, pool_size=16)
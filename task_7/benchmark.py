@@ -0,0 +1,118 @@
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from task_7.dice import calculate_probabilities, roll_dice
+from task_7.exact import identical_dice_pmf, max_abs_error, parse_dice, sum_distribution
+from task_7.montecarlo import simulate_adaptive, simulate_counts
+
+
+def measure(run):
+    """
+    Measures run time and peak traced memory of a callable.
+
+    :param run: A callable without arguments.
+    :return: A tuple of (seconds, peak bytes, result).
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = run()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+
+def bench_memory(num_rolls_list):
+    """
+    Compares the memory of roll_dice + calculate_probabilities with the chunked engine, both in one process.
+
+    :param num_rolls_list: The numbers of rolls to try.
+    """
+    print(f"{'rolls':>11} {'engine':<10} {'time, s':>10} {'peak, MB':>10}")
+    for num_rolls in num_rolls_list:
+        runs = [("roll_dice", lambda: calculate_probabilities(roll_dice(num_rolls))),
+                ("chunked", lambda: simulate_counts(num_rolls, seed=0, workers=1))]
+        for name, run in runs:
+            elapsed, peak, _ = measure(run)
+            print(f"{num_rolls:>11} {name:<10} {elapsed:>10.3f} {peak / 2 ** 20:>10.1f}")
+
+
+def bench_workers(num_rolls, worker_counts, dice=(6, 6)):
+    """
+    Reports simulation throughput for different numbers of worker processes and checks that the
+    histogram does not depend on the worker count.
+
+    :param num_rolls: The number of rolls.
+    :param worker_counts: The worker counts to try.
+    :param dice: The face counts of the dice.
+    """
+    print(f"{num_rolls} кидків, кубики {dice}, ядер: {os.cpu_count()}")
+    print(f"{'workers':>8} {'time, s':>10} {'rolls/s':>14} {'rolls/s/core':>14}")
+    reference = None
+    for workers in worker_counts:
+        start = time.perf_counter()
+        counts = simulate_counts(num_rolls, dice, seed=2024, workers=workers)
+        elapsed = time.perf_counter() - start
+        if reference is None:
+            reference = counts
+        assert np.array_equal(counts, reference)
+        rate = num_rolls / elapsed
+        print(f"{workers:>8} {elapsed:>10.3f} {rate:>14,.0f} {rate / min(workers, os.cpu_count() or 1):>14,.0f}")
+
+
+def bench_exact(specs, num_rolls_list):
+    """
+    Compares the exact distribution with simulations of growing size: the time of each and the
+    accuracy the simulation reaches.
+
+    :param specs: The dice to try, in dice notation.
+    :param num_rolls_list: The numbers of simulated rolls.
+    """
+    print(f"{'dice':<10} {'method':<14} {'time, s':>10} {'max error':>12}")
+    for spec in specs:
+        dice = parse_dice(spec)
+        identical_dice_pmf.cache_clear()
+        start = time.perf_counter()
+        exact = sum_distribution(dice)
+        print(f"{spec:<10} {'exact':<14} {time.perf_counter() - start:>10.5f} {0:>12.2e}")
+        for num_rolls in num_rolls_list:
+            start = time.perf_counter()
+            probabilities = simulate_counts(num_rolls, dice, seed=1) / num_rolls
+            elapsed = time.perf_counter() - start
+            error = max_abs_error(probabilities, exact)
+            print(f"{spec:<10} {f'{num_rolls:.0e} rolls':<14} {elapsed:>10.3f} {error:>12.2e}")
+
+
+def bench_adaptive(specs, tolerances):
+    """
+    Shows how many rolls the adaptive simulation spends per tolerance, and the error it actually reaches.
+
+    :param specs: The dice to try, in dice notation.
+    :param tolerances: The tolerances to try.
+    """
+    print(f"{'dice':<10} {'tolerance':>10} {'rolls':>12} {'time, s':>10} {'max error':>12}")
+    for spec in specs:
+        dice = parse_dice(spec)
+        exact = sum_distribution(dice)
+        for tolerance in tolerances:
+            start = time.perf_counter()
+            result = simulate_adaptive(dice, tolerance, seed=3)
+            elapsed = time.perf_counter() - start
+            error = max_abs_error(result.probabilities, exact)
+            print(f"{spec:<10} {tolerance:>10.0e} {result.rolls:>12} {elapsed:>10.3f} {error:>12.2e}")
+
+
+if __name__ == '__main__':
+    huge = '--huge' in sys.argv
+    bench_memory([10 ** 6, 10 ** 7] + ([10 ** 8] if huge else []))
+    print()
+    cores = os.cpu_count() or 1
+    bench_workers(10 ** 9 if huge else 10 ** 8, sorted({1, 2, 4, cores}))
+    print()
+    bench_exact(['2d6', '10d6', '100d20', '3d4+2d12'], [10 ** 5, 10 ** 6, 10 ** 7])
+    print()
+    bench_adaptive(['2d6', '10d6', '100d20'], [1e-2, 1e-3, 1e-4])
@@ -1,6 +1,8 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
+from task_7.montecarlo import simulate_adaptive
+
 
 def roll_dice(num_rolls):
     """
@@ -35,12 +37,13 @@ def calculate_probabilities(sums):
 
 if __name__ == '__main__':
 
-    num_rolls = 1000000
-
-    sums = roll_dice(num_rolls)
-    probabilities = calculate_probabilities(sums)
+    # Симулюємо, доки кожна ймовірність не буде відома з точністю до 0.05 відсоткового пункту
+    result = simulate_adaptive((6, 6), tolerance=0.0005, seed=2024)
+    probabilities = result.probabilities
+    print(f"Кидків: {result.rolls}, найширший довірчий інтервал: ±{result.trace[-1].max_half_width * 100:.3f}%")
 
-    plt.bar(range(2, len(probabilities)), probabilities[2:], tick_label=range(2, len(probabilities)))
+    plt.bar(range(2, len(probabilities)), probabilities[2:], yerr=result.half_widths[2:],
+            tick_label=range(2, len(probabilities)))
     plt.title('Ймовірності сум при киданні двох кубиків')
     plt.xlabel('Сума')
     plt.ylabel('Ймовірність')
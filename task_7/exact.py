@@ -0,0 +1,119 @@
+import re
+from collections import Counter
+from functools import lru_cache
+
+import numpy as np
+
+# Довжина, починаючи з якої згортка рахується через FFT; нижче неї хвости точні відносно, а не лише абсолютно
+FFT_THRESHOLD = 1 << 15
+
+
+def parse_dice(spec):
+    """
+    Parses dice notation such as '2d6' or '100d20+3d6' into the face counts of the individual dice.
+
+    :param spec: The dice notation.
+    :return: A tuple of face counts, one per die.
+    """
+    dice = []
+    for term in spec.replace(' ', '').lower().split('+'):
+        match = re.fullmatch(r'(\d*)d(\d+)', term)
+        if match is None:
+            raise ValueError(f"Invalid dice notation: {spec!r}")
+        dice.extend([int(match.group(2))] * int(match.group(1) or 1))
+    return tuple(dice)
+
+
+def convolve(a, b):
+    """
+    Convolves two probability mass functions indexed by value.
+
+    Inputs are convolved directly with np.convolve. It only adds non-negative products, so every
+    probability keeps its relative accuracy, down to the far tails such as P(100d20 = 100) = 20 ** -100.
+    Only when both inputs are longer than FFT_THRESHOLD, far beyond the dice sums tabulated in
+    practice, the product of their real FFTs is used instead. The FFT bounds just the absolute error
+    (about 1e-16 of the largest probability): tail values below it are noise, and tiny negative
+    values are clipped to zero.
+
+    :param a: The first PMF.
+    :param b: The second PMF.
+    :return: The PMF of the sum, of length len(a) + len(b) - 1.
+    """
+    if min(len(a), len(b)) <= FFT_THRESHOLD:
+        return np.convolve(a, b)
+    length = len(a) + len(b) - 1
+    size = 1 << (length - 1).bit_length()
+    result = np.fft.irfft(np.fft.rfft(a, size) * np.fft.rfft(b, size), size)[:length]
+    return np.maximum(result, 0, out=result)
+
+
+@lru_cache(maxsize=None)
+def die_pmf(sides):
+    """
+    Returns the PMF of a single fair die, indexed by face value (index 0 has probability 0).
+
+    :param sides: The number of faces.
+    :return: A read-only array of length sides + 1.
+    """
+    pmf = np.full(sides + 1, 1 / sides)
+    pmf[0] = 0
+    pmf.setflags(write=False)
+    return pmf
+
+
+@lru_cache(maxsize=256)
+def identical_dice_pmf(sides, count):
+    """
+    Returns the PMF of the sum of count identical dice, built by repeated squaring.
+
+    The sum of count dice is the convolution of the sums of count // 2 and count - count // 2 dice,
+    both of which are cached, so 100d20 takes about 2 * log2(100) convolutions instead of 99, and
+    other dice counts reuse the same intermediate PMFs.
+
+    :param sides: The number of faces of each die.
+    :param count: The number of dice.
+    :return: A read-only array indexed by sum, of length sides * count + 1.
+    """
+    if count == 0:
+        pmf = np.ones(1)
+    elif count == 1:
+        return die_pmf(sides)
+    else:
+        pmf = convolve(identical_dice_pmf(sides, count // 2), identical_dice_pmf(sides, count - count // 2))
+    pmf.setflags(write=False)
+    return pmf
+
+
+def sum_distribution(dice=(6, 6)):
+    """
+    Computes the exact probability of every sum of the given dice.
+
+    Dice with the same number of faces are combined by identical_dice_pmf, and the groups are then
+    convolved together, smallest first. Every probability is accurate to rounding relative to its
+    own size, as long as the sums stay below FFT_THRESHOLD values (see convolve).
+
+    :param dice: The face counts of the dice, e.g. (6, 6), (20,) * 100, or dice notation such as '100d20+3d6'.
+    :return: An array of probabilities indexed by sum, of length sum(dice) + 1, like calculate_probabilities.
+    """
+    if isinstance(dice, str):
+        dice = parse_dice(dice)
+    groups = sorted(Counter(dice).items(), key=lambda group: group[0] * group[1])
+    pmf = np.ones(1)
+    for sides, count in groups:
+        pmf = convolve(pmf, identical_dice_pmf(sides, count))
+    return pmf
+
+
+def max_abs_error(probabilities, exact):
+    """
+    Compares an estimate such as the result of calculate_probabilities with an exact distribution.
+
+    Both arrays are indexed by sum; the shorter one is padded with zeros.
+
+    :param probabilities: The estimated probabilities.
+    :param exact: The exact probabilities.
+    :return: The largest absolute difference over all sums.
+    """
+    length = max(len(probabilities), len(exact))
+    return np.abs(np.pad(probabilities, (0, length - len(probabilities)))
+                  - np.pad(exact, (0, length - len(exact)))).max()
@@ -0,0 +1,163 @@
+import os
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import count
+from statistics import NormalDist
+
+import numpy as np
+
+CHUNK_SIZE = 1 << 20
+BATCH_SIZE = 1 << 16
+
+AdaptiveResult = namedtuple('AdaptiveResult', ['probabilities', 'half_widths', 'rolls', 'converged', 'trace'])
+TraceStep = namedtuple('TraceStep', ['rolls', 'max_half_width', 'max_shift'])
+
+
+def _count_chunk(seed, size, dice):
+    """
+    Rolls one chunk and returns the histogram of its sums.
+
+    :param seed: The SeedSequence of the chunk.
+    :param size: The number of rolls.
+    :param dice: The face counts of the dice.
+    :return: An int64 array of counts indexed by sum, of length sum(dice) + 1.
+    """
+    rng = np.random.default_rng(seed)
+    # Грані вміщуються в uint8, суми — в найменший беззнаковий тип для sum(dice)
+    sums = np.zeros(size, dtype=np.min_scalar_type(sum(dice)))
+    for sides in dice:
+        sums += rng.integers(1, sides, size=size, dtype=np.uint8, endpoint=True)
+    return np.bincount(sums, minlength=sum(dice) + 1).astype(np.int64, copy=False)
+
+
+def iter_counts(num_rolls=None, dice=(6, 6), seed=None, chunk_size=CHUNK_SIZE, workers=None):
+    """
+    Simulates dice rolls chunk by chunk and yields the sum histogram of every chunk.
+
+    Every chunk gets its own generator seeded with the next child spawned from SeedSequence(seed),
+    so chunk i always produces the same rolls no matter how many workers there are or which of them
+    runs it. A passed SeedSequence keeps counting its children, so passing it again (or after other
+    spawns) gives new streams rather than repeating earlier ones. Chunks are yielded in order, and at
+    most two chunks per worker are in flight, so memory stays constant for any number of rolls.
+
+    :param num_rolls: The total number of rolls, or None for an endless stream of chunks.
+    :param dice: The face counts of the dice rolled together, at most 255 faces each, e.g. (6, 6) or (20,) * 100.
+    :param seed: An int, a SeedSequence or None for fresh entropy.
+    :param chunk_size: The number of rolls per chunk.
+    :param workers: The number of worker processes (default: os.cpu_count()); 1 runs in-process.
+    :return: A generator of int64 count arrays indexed by sum, of length sum(dice) + 1.
+    """
+    dice = tuple(dice)
+    if any(not 1 <= sides <= 255 for sides in dice):
+        raise ValueError("Dice must have from 1 to 255 faces")
+    root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    if num_rolls is None:
+        sizes = (chunk_size for _ in count())
+    else:
+        sizes = (min(chunk_size, num_rolls - start) for start in range(0, num_rolls, chunk_size))
+    # Нащадків породжуємо по одному, бо потік чанків може бути нескінченним
+    tasks = ((root.spawn(1)[0], size, dice) for size in sizes)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or (num_rolls is not None and num_rolls <= chunk_size):
+        for task in tasks:
+            yield _count_chunk(*task)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for task in tasks:
+            pending.append(executor.submit(_count_chunk, *task))
+            if len(pending) >= 2 * workers:
+                break
+        while pending:
+            future = pending.popleft()
+            for task in tasks:
+                pending.append(executor.submit(_count_chunk, *task))
+                break
+            yield future.result()
+
+
+def simulate_counts(num_rolls, dice=(6, 6), seed=None, chunk_size=CHUNK_SIZE, workers=None):
+    """
+    Simulates num_rolls rolls of the dice and counts every sum.
+
+    :param num_rolls: The number of rolls.
+    :param dice: The face counts of the dice rolled together.
+    :param seed: An int, a SeedSequence or None for fresh entropy.
+    :param chunk_size: The number of rolls per chunk.
+    :param workers: The number of worker processes (default: os.cpu_count()); 1 runs in-process.
+    :return: An int64 array of counts indexed by sum, of length sum(dice) + 1.
+    """
+    counts = np.zeros(sum(dice) + 1, dtype=np.int64)
+    for chunk_counts in iter_counts(num_rolls, dice, seed, chunk_size, workers):
+        counts += chunk_counts
+    return counts
+
+
+def simulate_probabilities(num_rolls, dice=(6, 6), seed=None, chunk_size=CHUNK_SIZE, workers=None):
+    """
+    Estimates the probability of every sum by simulation, indexed by sum like calculate_probabilities.
+
+    :param num_rolls: The number of rolls.
+    :param dice: The face counts of the dice rolled together.
+    :param seed: An int, a SeedSequence or None for fresh entropy.
+    :param chunk_size: The number of rolls per chunk.
+    :param workers: The number of worker processes (default: os.cpu_count()); 1 runs in-process.
+    :return: An array of probabilities indexed by sum, of length sum(dice) + 1.
+    :raises ValueError: if num_rolls is not positive.
+    """
+    if num_rolls <= 0:
+        raise ValueError(f"The number of rolls must be positive, got {num_rolls}")
+    counts = simulate_counts(num_rolls, dice, seed, chunk_size, workers)
+    return counts / num_rolls
+
+
+def simulate_adaptive(dice=(6, 6), tolerance=1e-3, confidence=0.99, seed=None, batch_size=BATCH_SIZE, workers=1,
+                      max_rolls=10 ** 10):
+    """
+    Simulates dice rolls batch by batch until every sum probability is known to within tolerance.
+
+    After every batch a confidence interval is computed for each possible sum. The intervals are
+    normal intervals around the smoothed estimate (count + 1) / (rolls + 2), so sums that have not
+    been seen yet cannot stop the simulation early. Their level is Bonferroni-corrected over all
+    possible sums, so that all of them hold together with the given confidence. The simulation
+    stops as soon as the widest half-width is at most tolerance, or after max_rolls rolls.
+
+    :param dice: The face counts of the dice rolled together.
+    :param tolerance: The required half-width of every confidence interval, in probability units.
+    :param confidence: The joint confidence level of the intervals.
+    :param seed: An int, a SeedSequence or None for fresh entropy.
+    :param batch_size: The number of rolls between convergence checks.
+    :param workers: The number of worker processes; 1 runs in-process.
+    :param max_rolls: The budget of rolls after which the simulation gives up.
+    :return: An AdaptiveResult with the probabilities and half-widths indexed by sum, the number of rolls,
+             whether the tolerance was met, and the convergence trace as a list of TraceStep
+             (rolls so far, widest half-width, largest change of an estimate since the previous batch).
+    """
+    dice = tuple(dice)
+    possible = np.zeros(sum(dice) + 1, dtype=bool)
+    possible[len(dice):] = True
+    z = NormalDist().inv_cdf(1 - (1 - confidence) / (2 * possible.sum()))
+
+    counts = np.zeros(sum(dice) + 1, dtype=np.int64)
+    probabilities = np.zeros(len(counts))
+    half_widths = np.full(len(counts), np.inf)
+    half_widths[~possible] = 0
+    rolls = 0
+    trace = []
+    chunks = iter_counts(None, dice, seed, batch_size, workers)
+    try:
+        for chunk_counts in chunks:
+            counts += chunk_counts
+            rolls += batch_size
+            previous, probabilities = probabilities, counts / rolls
+            smoothed = (counts[possible] + 1) / (rolls + 2)
+            half_widths[possible] = z * np.sqrt(smoothed * (1 - smoothed) / rolls)
+            trace.append(TraceStep(rolls, float(half_widths.max()), float(np.abs(probabilities - previous).max())))
+            if half_widths.max() <= tolerance or rolls + batch_size > max_rolls:
+                break
+    finally:
+        chunks.close()
+
+    return AdaptiveResult(probabilities, half_widths, rolls, bool(half_widths.max() <= tolerance), trace)
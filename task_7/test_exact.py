@@ -0,0 +1,28 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from task_7.exact import parse_dice, sum_distribution
+
+
+def test_matches_enumeration_of_mixed_dice():
+    dice = (3, 4, 4, 6)
+    counts = np.zeros(sum(dice) + 1)
+    for rolls in itertools.product(*(range(1, sides + 1) for sides in dice)):
+        counts[sum(rolls)] += 1
+    assert np.allclose(sum_distribution(dice), counts / counts.sum(), rtol=1e-12, atol=0)
+
+
+def test_tails_keep_relative_accuracy():
+    pmf = sum_distribution('100d20')
+    assert pmf[100] == pytest.approx(20.0 ** -100, rel=1e-9)
+    assert pmf[2000] == pytest.approx(20.0 ** -100, rel=1e-9)
+    assert pmf[101] == pytest.approx(100 * 20.0 ** -100, rel=1e-9)
+    assert np.all(pmf[100:] > 0)
+
+
+def test_parse_dice():
+    assert parse_dice('2d6 + d4') == (6, 6, 4)
+    with pytest.raises(ValueError):
+        parse_dice('2x6')
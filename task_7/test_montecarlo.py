@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from task_7.exact import sum_distribution
+from task_7.montecarlo import iter_counts, simulate_adaptive, simulate_counts, simulate_probabilities
+
+
+def test_counts_do_not_depend_on_workers():
+    single = simulate_counts(10 ** 4, seed=7, chunk_size=1000, workers=1)
+    pooled = simulate_counts(10 ** 4, seed=7, chunk_size=1000, workers=2)
+    assert single.sum() == 10 ** 4
+    np.testing.assert_array_equal(single, pooled)
+
+
+def test_seed_sequence_gives_new_streams_after_spawning():
+    seed = np.random.SeedSequence(7)
+    first = next(iter_counts(1000, seed=seed, workers=1))
+    second = next(iter_counts(1000, seed=seed, workers=1))
+    assert not np.array_equal(first, second)
+
+    spawned = np.random.SeedSequence(7)
+    spawned.spawn(1)
+    np.testing.assert_array_equal(next(iter_counts(1000, seed=spawned, workers=1)), second)
+
+
+def test_simulate_probabilities_rejects_no_rolls():
+    with pytest.raises(ValueError):
+        simulate_probabilities(0)
+
+
+@pytest.mark.parametrize('dice', [(6, 6), (4, 8), (6, 6, 6)])
+def test_adaptive_intervals_cover_exact_probabilities(dice):
+    exact = sum_distribution(dice)
+    covered = 0
+    for seed in range(20):
+        result = simulate_adaptive(dice, tolerance=5e-3, confidence=0.99, seed=seed, batch_size=1 << 12)
+        assert result.converged
+        covered += bool(np.all(np.abs(result.probabilities - exact) <= result.half_widths))
+    # Спільний рівень довіри 99%, тож на 20 прогонах допускаємо щонайбільше один промах
+    assert covered >= 19
+
+
+def test_adaptive_stops_at_the_first_batch_within_tolerance():
+    batch_size = 1 << 12
+    result = simulate_adaptive((6, 6), tolerance=5e-3, seed=1, batch_size=batch_size)
+    assert result.converged and result.half_widths.max() <= 5e-3
+    assert result.rolls % batch_size == 0 and len(result.trace) == result.rolls // batch_size
+    assert [step.rolls for step in result.trace] == list(range(batch_size, result.rolls + 1, batch_size))
+    assert result.trace[-1].max_half_width <= 5e-3 < result.trace[-2].max_half_width
+    # Неможливі суми мають нульову ймовірність і нульову ширину інтервалу
+    assert not result.probabilities[:2].any() and not result.half_widths[:2].any()
+    repeated = simulate_adaptive((6, 6), tolerance=5e-3, seed=1, batch_size=batch_size)
+    np.testing.assert_array_equal(repeated.probabilities, result.probabilities)
+
+
+def test_adaptive_gives_up_after_max_rolls():
+    result = simulate_adaptive((6, 6), tolerance=1e-5, seed=2, batch_size=1000, max_rolls=10 ** 4)
+    assert not result.converged
+    assert result.rolls == 10 ** 4
+    assert result.half_widths.max() > 1e-5